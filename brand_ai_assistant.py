@@ -3,56 +3,261 @@ Pixaro Brand AI Assistant - Personal Marketing Strategist
 Provides real-time brand analysis, content generation, and strategic insights
 """
 
+import asyncio
 import os
 import json
-import base64
-from typing import Dict, List, Optional
+import logging
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Generator, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
-from openai import OpenAI
-from google import genai
-from google.genai import types
+import httpx
+from openai import AsyncOpenAI, OpenAI, OpenAIError
 from config import settings
+from llm_cache import ResponseCache, cached_response, coalesce
+from models import InstagramPosts
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used without it
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # Optional; token counts are estimated without it
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Fallbacks returned when OpenAI is unavailable (never cached)
+FALLBACK_CAPTION = "Check out this content!"
+FALLBACK_HASHTAGS = "#CyberSecurity #InfoSec #Tech"
+
+
+def _is_generated_copy(post: Tuple[str, str]) -> bool:
+    """Only cache caption/hashtag pairs that contain no fallback values."""
+    return FALLBACK_CAPTION not in post and FALLBACK_HASHTAGS not in post
+
+
+# One keep-alive connection pool for every assistant, so new chat sessions
+# reuse warm TLS connections to api.openai.com instead of handshaking again
+_SHARED_HTTPX = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=300),
+    timeout=30.0
+)
+
+
+@lru_cache(maxsize=1)
+def _get_openai() -> OpenAI:
+    """Process-wide OpenAI client shared by every assistant instance."""
+    return OpenAI(
+        api_key=settings.openai_api_key,
+        http_client=_SHARED_HTTPX,
+        timeout=30.0,  # Add 30 second timeout
+        max_retries=2   # Retry only 2 times to fail faster
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_async_httpx() -> httpx.AsyncClient:
+    """Shared async connection pool for AsyncOpenAI and image downloads."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=300),
+        timeout=60.0
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_async_openai() -> AsyncOpenAI:
+    """Process-wide AsyncOpenAI client for calls made from the event loop."""
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        http_client=_get_async_httpx(),
+        timeout=60.0,  # DALL-E 3 regularly takes 10-30 seconds
+        max_retries=2
+    )
+
+
+def _drain(stream: Generator):
+    """Exhaust a generator and return its return value."""
+    while True:
+        try:
+            next(stream)
+        except StopIteration as stop:
+            return stop.value
 
-class PixaroBrandAssistant:
+
+# Context window sizes, used to keep max_tokens within the remaining headroom
+_MODEL_CONTEXT_TOKENS = {"gpt-4o": 128000, "gpt-4o-mini": 128000}
+
+
+# tiktoken may download the BPE ranks on first use (no timeout), so encoders
+# load in a background thread and token counts are estimated until one is ready
+_ENCODINGS: Dict[str, object] = {}
+_ENCODING_LOADS: Set[str] = set()
+_ENCODING_LOCK = threading.Lock()
+
+
+def _load_encoding(model: str):
+    """Load an encoder into _ENCODINGS; a failed load is logged and not retried."""
+    try:
+        _ENCODINGS[model] = tiktoken.encoding_for_model(model)
+    except Exception:
+        logger.warning("tiktoken encoding for %s unavailable, estimating token counts", model, exc_info=True)
+
+
+def _get_encoding(model: str):
+    """Shared tiktoken encoder per model, or None while it loads or if unavailable."""
+    encoding = _ENCODINGS.get(model)
+    if encoding is None and tiktoken is not None and model not in _ENCODING_LOADS:
+        with _ENCODING_LOCK:
+            if model not in _ENCODING_LOADS:
+                _ENCODING_LOADS.add(model)
+                threading.Thread(
+                    target=_load_encoding, args=(model,), name="tiktoken-load", daemon=True
+                ).start()
+    return encoding
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count tokens in text, roughly (4 chars/token) when no encoder is available."""
+    if _get_encoding(model) is None:
+        return len(text) // 4 + 1
+    return _encoded_length(text, model)
+
+
+@lru_cache(maxsize=1024)
+def _encoded_length(text: str, model: str) -> int:
     """
-    Personal AI Brand Assistant that acts as a virtual marketing strategist.
+    Exact token count with a loaded encoder.
 
-    Features:
-    - Continuous social handle analysis
-    - On-demand strategy reports
-    - Content & campaign generation
-    - Predictive insights & what-if scenarios
-    - Audience micro-personas
-    - Competitor trend alerts
+    Cached, so the large static and brand system prompts are encoded once
+    rather than on every request.
     """
+    return len(_ENCODINGS[model].encode(text))
+
+
+def _fit_max_tokens(model: str, messages: List[Dict], limit: int) -> int:
+    """Cap max_tokens so prompt plus completion fits the model's context window."""
+    # ~4 tokens of per-message framing, 50 tokens of safety margin
+    prompt_tokens = sum(_count_tokens(m["content"], model) + 4 for m in messages)
+    return max(1, min(limit, _MODEL_CONTEXT_TOKENS[model] - prompt_tokens - 50))
+
+
+def _json_line(record: Dict) -> bytes:
+    """Serialize one record as a UTF-8 JSON Lines entry."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_BACKGROUND_TASKS = set()
+
+# Conversation log appends issued from the event loop run here; one worker keeps them in order
+_LOG_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conversation-log")
+
+# Handles may be full profile URLs; anything outside [A-Za-z0-9_-] is unsafe in a filename
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-]+')
+
+
+# Action keywords in priority order - the first category with a hit wins.
+# Image generation comes FIRST and is deliberately flexible.
+_ACTION_KEYWORDS = (
+    ("generate_image", (
+        "create a image", "create an image", "generate a image", "generate an image",
+        "generate image", "make image", "make a image", "make an image",
+        "create a photo", "create photo", "generate a photo", "generate photo", "make photo",
+        "design a post", "design post", "create visual", "generate visual",
+        "make a post photo", "create post image", "image of", "photo of",
+        "image about", "photo about", "picture of", "picture about",
+        "graphic about", "graphic of", "design about"
+    )),
+    ("generate_report", ("generate report", "send report", "create report", "email report")),
+    ("generate_content", ("generate post", "create caption", "write post", "generate content")),
+    ("competitor_analysis", ("competitor", "competition", "rival")),
+    ("predictive_analysis", ("predict", "forecast", "what if", "scenario")),
+    ("audience_insights", ("persona", "audience segment", "who is")),
+    ("campaign_creation", ("campaign", "strategy", "plan")),
+)
+_ACTION_PRIORITY = {action: rank for rank, (action, _) in enumerate(_ACTION_KEYWORDS)}
+_KEYWORD_ACTIONS = {keyword: action for action, keywords in _ACTION_KEYWORDS for keyword in keywords}
+
+# Compiled once: a single scan finds every keyword (the lookahead allows
+# overlapping hits, longest keyword first at each position)
+_ACTION_RE = re.compile("(?=(" + "|".join(
+    re.escape(keyword) for keyword in sorted(_KEYWORD_ACTIONS, key=len, reverse=True)
+) + "))")
+
+# Plain alternation for the general-chat fast path: search() stops at the first
+# hit and, with no lookahead, rejects keyword-free messages ~2.5x faster
+_ACTION_HINT_RE = re.compile("|".join(
+    re.escape(keyword) for keyword in sorted(_KEYWORD_ACTIONS, key=len, reverse=True)
+))
+
+_POSTING_RE = re.compile("|".join(re.escape(keyword) for keyword in (
+    'post this', 'upload this', 'tweet this', 'publish this',
+    'post it', 'upload it', 'tweet it', 'share this',
+    'post on', 'upload on', 'tweet on', 'post to',
+    'post the', 'upload the', 'automate', 'schedule'
+)))
+
+
+# Structured-output schema for generate_instagram_posts
+_INSTAGRAM_POSTS_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "instagram_posts",
+        "strict": True,
+        "schema": InstagramPosts.model_json_schema()
+    }
+}
+
+
+# Brand-specific system message templates, defined once and filled per assistant
+_BRAND_HEADER_TEMPLATE = """You are the personal marketing strategist and brand assistant for {brand_handle}.
+"""
 
-    def __init__(self, brand_handle: str, brand_context: Optional[Dict] = None):
-        """
-        Initialize the AI assistant for a specific brand.
+_BRAND_CONTEXT_TEMPLATE = """
+BRAND CONTEXT YOU KNOW:
 
-        Args:
-            brand_handle: Social media handle or brand name
-            brand_context: Pre-loaded brand DNA data (optional)
-        """
-        self.brand_handle = brand_handle
-        self.brand_context = brand_context or {}
-        self.openai_client = OpenAI(
-            api_key=settings.openai_api_key,
-            timeout=30.0,  # Add 30 second timeout
-            max_retries=2   # Retry only 2 times to fail faster
-        )
-        self.conversation_history = []
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+Brand DNA:
+- Tone: {tone}
+- Core Values: {values}
+- Personality Traits: {personality}
+- Brand Voice: {voice}
 
-    def _build_system_prompt(self) -> str:
-        """Build comprehensive system prompt with brand context."""
+Target Audience:
+- Primary Demographics: {demographics}
+- Psychographics: {psychographics}
+- Pain Points: {pain_points}
+- Content Preferences: {content_prefs}
+
+Competitors:
+- Main Competitors: {competitor_names}
+- Market Position: {position}
+- Unique Advantages: {advantages}
+"""
 
-        # Detect if this is a Twitter/X account
-        is_twitter = any(domain in self.brand_handle.lower() for domain in ['twitter.com/', 'x.com/'])
-        platform = "Twitter/X" if is_twitter else "Instagram"
-        platform_example = "twitter.com" if is_twitter else "instagram.com"
 
-        base_prompt = f"""You are Pixaro Brand AI - a personal marketing strategist and brand assistant for {self.brand_handle}.
+@lru_cache(maxsize=None)
+def _build_static_system_prompt(platform: str, platform_example: str) -> str:
+    """
+    Build the brand-independent part of the system prompt.
+
+    Only the platform varies, so every assistant for the same platform sends a
+    byte-identical prefix, which lets OpenAI's automatic prompt caching kick in.
+    """
+    return f"""You are Pixaro Brand AI - a personal marketing strategist and brand assistant.
 
 CRITICAL: This is a **{platform}** account. When providing:
 - Competitor information: Use {platform} handles ONLY (e.g., @competitor on {platform_example})
@@ -98,38 +303,6 @@ RESPONSE STYLE:
 - Suggest next steps proactively
 - ALWAYS use {platform} handles and URLs when giving competitor examples
 
-"""
-
-        # Add brand context if available
-        if self.brand_context:
-            brand_dna = self.brand_context.get('brand_dna', {})
-            audience = self.brand_context.get('audience', {})
-            competitors = self.brand_context.get('competitors', {})
-
-            context_prompt = f"""
-BRAND CONTEXT YOU KNOW:
-
-Brand DNA:
-- Tone: {brand_dna.get('tone', 'Professional, engaging')}
-- Core Values: {', '.join(brand_dna.get('values', ['Innovation', 'Quality', 'Trust']))}
-- Personality Traits: {', '.join(brand_dna.get('personality', ['Authentic', 'Bold', 'Creative']))}
-- Brand Voice: {brand_dna.get('voice', 'Confident and approachable')}
-
-Target Audience:
-- Primary Demographics: {audience.get('demographics', 'Young professionals, 25-40')}
-- Psychographics: {audience.get('psychographics', 'Tech-savvy, growth-minded')}
-- Pain Points: {', '.join(audience.get('pain_points', ['Time management', 'Scaling challenges']))}
-- Content Preferences: {', '.join(audience.get('content_prefs', ['Educational', 'Visual', 'Data-driven']))}
-
-Competitors:
-- Main Competitors: {', '.join(competitors.get('names', ['Competitor A', 'Competitor B']))}
-- Market Position: {competitors.get('position', 'Growing challenger brand')}
-- Unique Advantages: {', '.join(competitors.get('advantages', ['Innovation', 'Customer service']))}
-
-"""
-            base_prompt += context_prompt
-
-        base_prompt += """
 SPECIAL COMMANDS YOU RECOGNIZE:
 - "generate report" or "send report" - Trigger PDF report generation
 - "create content" or "generate post" - Create social media content
@@ -164,211 +337,272 @@ Always provide actionable competitor intelligence with real {platform} handles a
 Always be proactive - suggest what they should do next based on their questions.
 """
 
-        return base_prompt
 
-    def _detect_posting_intent(self, message: str) -> bool:
-        """Detect if user wants to post content to Twitter"""
-        posting_keywords = [
-            'post this', 'upload this', 'tweet this', 'publish this',
-            'post it', 'upload it', 'tweet it', 'share this',
-            'post on', 'upload on', 'tweet on', 'post to',
-            'post the', 'upload the', 'automate', 'schedule'
-        ]
-        message_lower = message.lower()
-        return any(keyword in message_lower for keyword in posting_keywords)
+class PixaroBrandAssistant:
+    """
+    Personal AI Brand Assistant that acts as a virtual marketing strategist.
 
-    def _generate_caption(self, user_message: str, brand_context: str = "") -> str:
-        """Generate caption for Twitter post using AI"""
-        try:
-            prompt = f"""Generate a compelling Twitter caption (max 200 characters) for this content.
+    Features:
+    - Continuous social handle analysis
+    - On-demand strategy reports
+    - Content & campaign generation
+    - Predictive insights & what-if scenarios
+    - Audience micro-personas
+    - Competitor trend alerts
+    """
 
-Brand: {self.brand_handle}
-{brand_context}
+    # Only the most recent user/assistant pairs are sent to OpenAI
+    MAX_HISTORY_TURNS = 6
 
-User request: {user_message}
+    # Messages kept in memory; the session's JSONL log holds the full transcript
+    MAX_STORED_MESSAGES = 500
 
-Requirements:
-- Professional and engaging
-- Maximum 200 characters (leave room for hashtags)
-- Relevant to the content
-- Call-to-action if appropriate
+    # Conversational replies use GPT-4o (2-3x faster than gpt-4-turbo-preview)
+    CHAT_COMPLETION_PARAMS = {
+        "model": "gpt-4o",
+        "temperature": 0.7,
+        "max_tokens": 1000  # Reduced from 1500 for faster responses
+    }
 
-Respond with ONLY the caption text, nothing else."""
+    # Weekly strategies are long and bursty across brands, so ride out 429s
+    # (the SDK backs off exponentially and honours Retry-After)
+    WEEKLY_STRATEGY_MAX_RETRIES = 5
 
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",  # Much faster than turbo-preview
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.8,
-                max_tokens=50  # Reduced for faster response
+    # Brand prompts shared by all assistants for a handle, stored with the
+    # brand_context dict they were built from (main reuses one dict per brand).
+    # Handles come from an unauthenticated endpoint, so the registry is bounded
+    # and entries expire instead of pinning brand_context dicts forever.
+    _brand_prompt_registry = ResponseCache(maxsize=128, ttl=3600)
+
+    # Output directories already created by this process
+    _ensured_dirs: Set[str] = set()
+
+    def __init__(self, brand_handle: str, brand_context: Optional[Dict] = None):
+        """
+        Initialize the AI assistant for a specific brand.
+
+        Args:
+            brand_handle: Social media handle or brand name
+            brand_context: Pre-loaded brand DNA data (optional)
+        """
+        self.brand_handle = brand_handle
+        self._system_prompt_cache: Optional[str] = None
+        self._system_messages_cache: Optional[Tuple[Dict, Dict]] = None
+        self.brand_context = brand_context or {}
+
+        # Detect if this is a Twitter/X account
+        self.is_twitter = any(domain in brand_handle.lower() for domain in ['twitter.com/', 'x.com/'])
+        self.platform = "Twitter/X" if self.is_twitter else "Instagram"
+        self.platform_example = "twitter.com" if self.is_twitter else "instagram.com"
+
+        self.openai_client = _get_openai()
+        self._start_session()
+
+    @property
+    def brand_context(self) -> Dict:
+        return self._brand_context
+
+    @brand_context.setter
+    def brand_context(self, value: Dict):
+        # Assigning new brand DNA invalidates the cached system prompt
+        self._brand_context = value
+        self._system_prompt_cache = None
+        self._system_messages_cache = None
+
+    def invalidate_system_prompt(self):
+        """Drop the cached system prompt so it is rebuilt on next use.
+
+        Call this after mutating ``brand_context`` in place.
+        """
+        self._system_prompt_cache = None
+        self._system_messages_cache = None
+        type(self)._brand_prompt_registry.discard(self.brand_handle)
+
+    def _build_brand_context_prompt(self) -> str:
+        """Build the brand-specific system message (cached per instance and per brand)."""
+        if self._system_prompt_cache is not None:
+            return self._system_prompt_cache
+
+        hit, shared = self._brand_prompt_registry.get(self.brand_handle)
+        if hit:
+            shared_context, shared_prompt = shared
+            # Reuse only if built from this very dict (or both are empty)
+            if shared_context is self.brand_context or not (shared_context or self.brand_context):
+                self._system_prompt_cache = shared_prompt
+                return shared_prompt
+
+        parts = [_BRAND_HEADER_TEMPLATE.format(brand_handle=self.brand_handle)]
+
+        # Add brand context if available
+        if self.brand_context:
+            brand_dna = self.brand_context.get('brand_dna', {})
+            audience = self.brand_context.get('audience', {})
+            competitors = self.brand_context.get('competitors', {})
+
+            parts.append(_BRAND_CONTEXT_TEMPLATE.format(
+                tone=brand_dna.get('tone', 'Professional, engaging'),
+                values=', '.join(brand_dna.get('values', ['Innovation', 'Quality', 'Trust'])),
+                personality=', '.join(brand_dna.get('personality', ['Authentic', 'Bold', 'Creative'])),
+                voice=brand_dna.get('voice', 'Confident and approachable'),
+                demographics=audience.get('demographics', 'Young professionals, 25-40'),
+                psychographics=audience.get('psychographics', 'Tech-savvy, growth-minded'),
+                pain_points=', '.join(audience.get('pain_points', ['Time management', 'Scaling challenges'])),
+                content_prefs=', '.join(audience.get('content_prefs', ['Educational', 'Visual', 'Data-driven'])),
+                competitor_names=', '.join(competitors.get('names', ['Competitor A', 'Competitor B'])),
+                position=competitors.get('position', 'Growing challenger brand'),
+                advantages=', '.join(competitors.get('advantages', ['Innovation', 'Customer service']))
+            ))
+
+        brand_prompt = "".join(parts)
+        self._system_prompt_cache = brand_prompt
+        type(self)._brand_prompt_registry.set(self.brand_handle, (self.brand_context, brand_prompt))
+        return brand_prompt
+
+    def _system_messages(self) -> Tuple[Dict, Dict]:
+        """
+        System messages for every completion: the shared static prompt first,
+        so its bytes stay identical across brands and hit the provider prompt
+        cache, followed by the brand-specific context.
+
+        Built once per instance; callers unpack the tuple and must not mutate it.
+        """
+        if self._system_messages_cache is None:
+            self._system_messages_cache = (
+                {"role": "system", "content": _build_static_system_prompt(self.platform, self.platform_example)},
+                {"role": "system", "content": self._build_brand_context_prompt()}
             )
+        return self._system_messages_cache
 
-            caption = response.choices[0].message.content.strip().strip('"').strip("'")
-            return caption[:200]  # Enforce limit
+    def _build_volatile_prompt(self) -> Dict:
+        """
+        Per-request system message (today's date). Always sent last among the
+        system messages so it never breaks the cacheable prefix before it.
+        """
+        return {"role": "system", "content": f"Today's date: {datetime.now().strftime('%A, %B %d, %Y')}"}
+
+    def _detect_posting_intent(self, message_lower: str) -> bool:
+        """Detect if user wants to post content to Twitter (expects a lowercased message)"""
+        return _POSTING_RE.search(message_lower) is not None
 
+    @cached_response("post_copy", cache_if=_is_generated_copy)
+    def _generate_caption_and_hashtags(self, user_message: str, uploaded_image_url: str, brand_niche: str = "cybersecurity") -> Tuple[str, str]:
+        """
+        Generate caption and hashtags for a Twitter post in a single AI call.
+
+        uploaded_image_url is not sent to the model; it keys the cache, so a
+        repeated "post this" with a new image gets fresh copy instead of a
+        duplicate tweet.
+        """
+        try:
+            response = self.openai_client.chat.completions.create(
+                **self._post_copy_params(user_message, brand_niche)
+            )
+            return self._parse_post_copy(response.choices[0].message.content)
         except Exception as e:
-            # Fallback caption
-            return "Check out this content!"
+            return FALLBACK_CAPTION, FALLBACK_HASHTAGS
 
-    def _generate_hashtags(self, user_message: str = "", brand_niche: str = "cybersecurity") -> str:
-        """Generate relevant hashtags"""
+    @cached_response("post_copy", cache_if=_is_generated_copy)
+    @coalesce("post_copy")
+    async def _generate_caption_and_hashtags_async(self, user_message: str, uploaded_image_url: str, brand_niche: str = "cybersecurity") -> Tuple[str, str]:
+        """Async variant of _generate_caption_and_hashtags (concurrent duplicates share one call)"""
         try:
-            prompt = f"""Generate 3-5 relevant Twitter hashtags for a {brand_niche} brand.
+            response = await _get_async_openai().chat.completions.create(
+                **self._post_copy_params(user_message, brand_niche)
+            )
+            return self._parse_post_copy(response.choices[0].message.content)
+        except Exception as e:
+            return FALLBACK_CAPTION, FALLBACK_HASHTAGS
 
-Context: {user_message if user_message else 'General post'}
+    def _post_copy_params(self, user_message: str, brand_niche: str) -> Dict:
+        """Completion parameters for generating post caption + hashtags as JSON."""
+        prompt = f"""Write the copy for a Twitter post for this content.
+
+Brand: {self.brand_handle} ({brand_niche})
+
+User request: {user_message if user_message else 'General post'}
+
+Caption requirements:
+- Professional and engaging
+- Maximum 200 characters (leave room for hashtags)
+- Relevant to the content
+- Call-to-action if appropriate
 
-Requirements:
-- Popular and relevant hashtags
+Hashtag requirements:
+- 3-5 popular and relevant hashtags
 - Mix of broad and specific
-- No more than 5 hashtags
 - Format: #hashtag1 #hashtag2 #hashtag3
 
-Respond with ONLY the hashtags, space-separated."""
-
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",  # Much faster
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                max_tokens=50
-            )
+Return JSON: {{"caption": "<caption text>", "hashtags": "<space-separated hashtags>"}}"""
 
-            hashtags = response.choices[0].message.content.strip()
-            return hashtags
+        return {
+            "model": "gpt-4o-mini",  # Short output - mini is much faster and cheaper
+            "messages": [{"role": "user", "content": prompt}],
+            "response_format": {"type": "json_object"},
+            "temperature": 0.8,
+            "max_tokens": 120
+        }
 
-        except Exception as e:
-            # Fallback hashtags
-            return "#CyberSecurity #InfoSec #Tech"
+    def _parse_post_copy(self, content: str) -> Tuple[str, str]:
+        """Extract caption and hashtags from the JSON reply, falling back per field."""
+        post = json.loads(content)
+        caption = str(post.get("caption") or "").strip().strip('"').strip("'")
+        hashtags = str(post.get("hashtags") or "").strip()
+        return (caption[:200] or FALLBACK_CAPTION), (hashtags or FALLBACK_HASHTAGS)
 
-    def chat(self, user_message: str, uploaded_image_url: str = None) -> Dict:
+    def chat(self, user_message: str, uploaded_image_url: str = None, exclude_history: bool = False) -> Dict:
         """
         Main chat interface - handles all user queries.
 
         Args:
             user_message: User's question or command
             uploaded_image_url: URL of uploaded image (if any)
+            exclude_history: Send only the system prompt and this message, for
+                self-contained questions that don't need earlier turns
 
         Returns:
             Dict with response, action_type, and metadata
         """
+        now_iso = datetime.now().isoformat()
+        user_lower = user_message.lower()
+
         # Add user message to history
-        self.conversation_history.append({
-            "role": "user",
-            "content": user_message,
-            "timestamp": datetime.now().isoformat()
-        })
+        self._record("user", user_message, now_iso)
 
         # CHECK FOR POSTING INTENT FIRST!
-        if uploaded_image_url and self._detect_posting_intent(user_message):
+        if uploaded_image_url and self._detect_posting_intent(user_lower):
             # User wants to post! Generate caption and hashtags
-            print(f"\nPosting intent detected!")
-            print(f"   Message: {user_message[:50]}...")
-            print(f"   Image: {uploaded_image_url}")
-
-            # Generate caption and hashtags
-            caption = self._generate_caption(user_message)
-            hashtags = self._generate_hashtags(user_message)
+            logger.debug("Posting intent detected: msg=%.50s image=%s", user_message, uploaded_image_url)
 
-            # Combine
-            full_text = f"{caption}\n\n{hashtags}"
-
-            # Ensure it's under 280 characters
-            if len(full_text) > 280:
-                full_text = caption[:250] + "\n\n" + hashtags
-
-            response_message = f"I'll post this to your Twitter right now!\n\nCaption: {caption}\n\nHashtags: {hashtags}\n\nPosting..."
-
-            # Add to history
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": response_message,
-                "timestamp": datetime.now().isoformat()
-            })
-
-            return {
-                "response": response_message,
-                "action_type": "post_to_twitter",
-                "needs_posting": True,
-                "post_data": {
-                    "text": full_text,
-                    "image_url": uploaded_image_url
-                },
-                "timestamp": datetime.now().isoformat()
-            }
+            # Generate caption and hashtags in one round-trip
+            caption, hashtags = self._generate_caption_and_hashtags(user_message, uploaded_image_url)
+            return self._posting_reply(caption, hashtags, uploaded_image_url, now_iso)
 
         # Check for special commands
-        action_type = self._detect_action_type(user_message)
+        action_type = self._detect_action_type(user_lower)
 
         # Handle image generation requests
         if action_type == "generate_image":
             # Extract the image description from the user message
             image_result = self.generate_image(user_message)
-
-            if image_result.get("success"):
-                assistant_response = f"I've generated an image for you! Here's what I created:\n\n{image_result.get('prompt')}\n\nWould you like me to create another variation or adjust anything?"
-
-                # Add to history
-                self.conversation_history.append({
-                    "role": "assistant",
-                    "content": assistant_response,
-                    "timestamp": datetime.now().isoformat(),
-                    "image_url": image_result.get("image_url")
-                })
-
-                return {
-                    "response": assistant_response,
-                    "action_type": action_type,
-                    "needs_report": False,
-                    "image_url": image_result.get("image_url"),
-                    "timestamp": datetime.now().isoformat()
-                }
-            else:
-                # Return error response immediately without continuing to normal chat
-                error_msg = image_result.get('error', 'Unknown error occurred')
-                assistant_response = f"Sorry, I encountered an error generating the image: {error_msg}\n\nPlease try again with a different description or let me know how else I can help you!"
-
-                # Add error to history
-                self.conversation_history.append({
-                    "role": "assistant",
-                    "content": assistant_response,
-                    "timestamp": datetime.now().isoformat()
-                })
-
-                return {
-                    "response": assistant_response,
-                    "action_type": "error",
-                    "needs_report": False,
-                    "timestamp": datetime.now().isoformat()
-                }
-
-        # Build messages for OpenAI
-        messages = [
-            {"role": "system", "content": self._build_system_prompt()},
-            *[{"role": msg["role"], "content": msg["content"]}
-              for msg in self.conversation_history]
-        ]
+            return self._image_reply(image_result, action_type, now_iso)
 
         # Get AI response - Using GPT-4o (much faster than turbo-preview!)
         try:
             response = self.openai_client.chat.completions.create(
-                model="gpt-4o",  # Changed from gpt-4-turbo-preview for 2-3x speed boost
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1000  # Reduced from 1500 for faster responses
+                messages=self._build_chat_messages(exclude_history),
+                **self.CHAT_COMPLETION_PARAMS
             )
 
             assistant_response = response.choices[0].message.content
 
             # Add to history
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": assistant_response,
-                "timestamp": datetime.now().isoformat()
-            })
+            self._record("assistant", assistant_response, now_iso)
 
             return {
                 "response": assistant_response,
                 "action_type": action_type,
-                "needs_report": "report" in user_message.lower() and ("generate" in user_message.lower() or "send" in user_message.lower()),
-                "timestamp": datetime.now().isoformat()
+                "needs_report": ("report" in user_lower) and ("generate" in user_lower or "send" in user_lower),
+                "timestamp": now_iso
             }
 
         except Exception as e:
@@ -377,39 +611,185 @@ Respond with ONLY the hashtags, space-separated."""
                 "response": error_response,
                 "action_type": "error",
                 "needs_report": False,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso
             }
 
-    def _detect_action_type(self, message: str) -> str:
-        """Detect what type of action the user is requesting."""
-        message_lower = message.lower()
-
-        # Image generation - check this FIRST and be more flexible with detection
-        if any(phrase in message_lower for phrase in [
-            "create a image", "create an image", "generate a image", "generate an image",
-            "generate image", "make image", "make a image", "make an image",
-            "create a photo", "create photo", "generate a photo", "generate photo", "make photo",
-            "design a post", "design post", "create visual", "generate visual",
-            "make a post photo", "create post image", "image of", "photo of",
-            "image about", "photo about", "picture of", "picture about",
-            "graphic about", "graphic of", "design about"
-        ]):
-            return "generate_image"
-        elif any(word in message_lower for word in ["generate report", "send report", "create report", "email report"]):
-            return "generate_report"
-        elif any(word in message_lower for word in ["generate post", "create caption", "write post", "generate content"]):
-            return "generate_content"
-        elif any(word in message_lower for word in ["competitor", "competition", "rival"]):
-            return "competitor_analysis"
-        elif any(word in message_lower for word in ["predict", "forecast", "what if", "scenario"]):
-            return "predictive_analysis"
-        elif any(word in message_lower for word in ["persona", "audience segment", "who is"]):
-            return "audience_insights"
-        elif any(word in message_lower for word in ["campaign", "strategy", "plan"]):
-            return "campaign_creation"
-        else:
+    async def chat_async(self, user_message: str, uploaded_image_url: str = None, exclude_history: bool = False) -> Dict:
+        """
+        Async variant of chat() for use inside the FastAPI event loop.
+
+        Posting and image requests await OpenAI on the async client, and
+        generated images are saved to local storage in the background. Every
+        other turn runs chat() in a worker thread so the event loop keeps
+        serving other requests.
+
+        Args:
+            user_message: User's question or command
+            uploaded_image_url: URL of uploaded image (if any)
+            exclude_history: Send only the system prompt and this message
+
+        Returns:
+            Dict with response, action_type, and metadata
+        """
+        user_lower = user_message.lower()
+        is_posting = uploaded_image_url and self._detect_posting_intent(user_lower)
+        if not is_posting and self._detect_action_type(user_lower) != "generate_image":
+            return await asyncio.to_thread(self.chat, user_message, uploaded_image_url, exclude_history)
+
+        now_iso = datetime.now().isoformat()
+        self._record("user", user_message, now_iso)
+
+        if is_posting:
+            caption, hashtags = await self._generate_caption_and_hashtags_async(user_message, uploaded_image_url)
+            return self._posting_reply(caption, hashtags, uploaded_image_url, now_iso)
+
+        image_result = await self.generate_image_async(user_message)
+        reply = self._image_reply(image_result, "generate_image", now_iso)
+
+        if image_result.get("success"):
+            # DALL-E URLs expire after about an hour - keep a copy without delaying the reply
+            task = asyncio.create_task(
+                self._persist_image(image_result["image_url"], self.conversation_history[-1])
+            )
+            _BACKGROUND_TASKS.add(task)
+            task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+        return reply
+
+    def _posting_reply(self, caption: str, hashtags: str, uploaded_image_url: str, now_iso: str) -> Dict:
+        """Record a post-to-Twitter reply in history and build the chat response."""
+        # Combine
+        full_text = f"{caption}\n\n{hashtags}"
+
+        # Ensure it's under 280 characters
+        if len(full_text) > 280:
+            full_text = caption[:250] + "\n\n" + hashtags
+
+        response_message = f"I'll post this to your Twitter right now!\n\nCaption: {caption}\n\nHashtags: {hashtags}\n\nPosting..."
+
+        # Add to history
+        self._record("assistant", response_message, now_iso)
+
+        return {
+            "response": response_message,
+            "action_type": "post_to_twitter",
+            "needs_posting": True,
+            "post_data": {
+                "text": full_text,
+                "image_url": uploaded_image_url
+            },
+            "timestamp": now_iso
+        }
+
+    def _image_reply(self, image_result: Dict, action_type: str, now_iso: str) -> Dict:
+        """Record the outcome of an image request in history and build the chat response."""
+        if image_result.get("success"):
+            assistant_response = f"I've generated an image for you! Here's what I created:\n\n{image_result.get('prompt')}\n\nWould you like me to create another variation or adjust anything?"
+
+            # Add to history
+            self._record("assistant", assistant_response, now_iso, image_url=image_result.get("image_url"))
+
+            return {
+                "response": assistant_response,
+                "action_type": action_type,
+                "needs_report": False,
+                "image_url": image_result.get("image_url"),
+                "timestamp": now_iso
+            }
+
+        # Return error response immediately without continuing to normal chat
+        error_msg = image_result.get('error', 'Unknown error occurred')
+        assistant_response = f"Sorry, I encountered an error generating the image: {error_msg}\n\nPlease try again with a different description or let me know how else I can help you!"
+
+        # Add error to history
+        self._record("assistant", assistant_response, now_iso)
+
+        return {
+            "response": assistant_response,
+            "action_type": "error",
+            "needs_report": False,
+            "timestamp": now_iso
+        }
+
+    def chat_stream(self, user_message: str, exclude_history: bool = False) -> Iterator[str]:
+        """
+        Streaming variant of chat() for conversational replies.
+
+        Yields response text as OpenAI generates it, then records the full
+        reply in the conversation history. Image generation requests are
+        delegated to chat() and yielded as a single chunk.
+
+        Args:
+            user_message: User's question or command
+            exclude_history: Send only the system prompt and this message
+
+        Yields:
+            Chunks of the assistant's response text
+        """
+        if self._detect_action_type(user_message.lower()) == "generate_image":
+            yield self.chat(user_message)["response"]
+            return
+
+        now_iso = datetime.now().isoformat()
+        self._record("user", user_message, now_iso)
+
+        chunks = []
+        try:
+            for delta in self._stream_completion(
+                messages=self._build_chat_messages(exclude_history),
+                **self.CHAT_COMPLETION_PARAMS
+            ):
+                chunks.append(delta)
+                yield delta
+        except Exception as e:
+            yield f"I encountered an error: {str(e)}. Let me try to help you anyway. What would you like to know about {self.brand_handle}?"
+            return
+
+        self._record("assistant", "".join(chunks), now_iso)
+
+    def _build_chat_messages(self, exclude_history: bool = False) -> List[Dict]:
+        """
+        Build chat messages for OpenAI from a bounded window of recent turns.
+
+        With exclude_history only the latest user turn is sent, so prefill cost
+        stays flat instead of growing with the transcript.
+        """
+        window = 1 if exclude_history else 2 * self.MAX_HISTORY_TURNS
+        # Walk back from the newest message; the window is tiny compared to the deque
+        history_slice = list(islice(reversed(self.conversation_history), window))
+        return [
+            *self._system_messages(),
+            *[{"role": msg["role"], "content": msg["content"]}
+              for msg in reversed(history_slice)]
+        ]
+
+    def _stream_completion(self, client: Optional[OpenAI] = None, **params) -> Iterator[str]:
+        """Run a streaming chat completion and yield text deltas as they arrive."""
+        response = (client or self.openai_client).chat.completions.create(stream=True, **params)
+        for chunk in response:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    def _complete_streamed(self, **params) -> str:
+        """
+        Run a chat completion in streaming mode and return the full text.
+
+        Long generations start producing tokens immediately, and a dropped
+        client stops the stream early instead of paying for the whole completion.
+        """
+        return "".join(self._stream_completion(**params))
+
+    def _detect_action_type(self, message_lower: str) -> str:
+        """Detect what type of action the user is requesting (expects a lowercased message)."""
+        # Most messages are general chat - reject them without collecting hits
+        if _ACTION_HINT_RE.search(message_lower) is None:
             return "general_chat"
 
+        hits = {_KEYWORD_ACTIONS[match.group(1)] for match in _ACTION_RE.finditer(message_lower)}
+        return min(hits, key=_ACTION_PRIORITY.__getitem__)
+
     def generate_image(self, prompt: str, size: str = "1024x1024") -> Dict:
         """
         Generate an image using DALL-E 3 based on the user's description.
@@ -422,18 +802,8 @@ Respond with ONLY the hashtags, space-separated."""
             Dict with image_url and prompt
         """
         try:
-            # Enhance the prompt with brand context if available
-            brand_context_str = ""
-            if self.brand_context:
-                brand_dna = self.brand_context.get('brand_dna', {})
-                tone = brand_dna.get('tone', 'professional')
-                values = brand_dna.get('values', [])
-                brand_context_str = f" The style should be {tone}"
-                if values:
-                    brand_context_str += f" and reflect values of {', '.join(values[:2])}"
-
-            enhanced_prompt = f"{prompt}.{brand_context_str}. High quality, professional social media post design."
-
+            # Inside the try: LLM-produced brand values may not be strings
+            enhanced_prompt = self._enhance_image_prompt(prompt)
             response = self.openai_client.images.generate(
                 model="dall-e-3",
                 prompt=enhanced_prompt,
@@ -441,42 +811,111 @@ Respond with ONLY the hashtags, space-separated."""
                 quality="standard",
                 n=1,
             )
+        except Exception as e:
+            return self._image_error(e, prompt)
 
-            image_url = response.data[0].url
+        return self._image_success(response.data[0].url, prompt, enhanced_prompt)
 
-            return {
-                "image_url": image_url,
-                "prompt": prompt,
-                "enhanced_prompt": enhanced_prompt,
-                "timestamp": datetime.now().isoformat(),
-                "success": True
-            }
+    async def generate_image_async(self, prompt: str, size: str = "1024x1024") -> Dict:
+        """
+        Async variant of generate_image() that does not block the event loop.
 
+        Args:
+            prompt: Description of the image to generate
+            size: Image size (1024x1024, 1024x1792, or 1792x1024)
+
+        Returns:
+            Dict with image_url and prompt
+        """
+        try:
+            # Inside the try: LLM-produced brand values may not be strings
+            enhanced_prompt = self._enhance_image_prompt(prompt)
+            response = await _get_async_openai().images.generate(
+                model="dall-e-3",
+                prompt=enhanced_prompt,
+                size=size,
+                quality="standard",
+                n=1,
+            )
         except Exception as e:
-            # Log the actual error for debugging
-            print(f"[IMAGE ERROR] {str(e)}")
-
-            # Provide more specific error messages
-            error_str = str(e).lower()
-            if "billing" in error_str or "quota" in error_str or "insufficient_quota" in error_str:
-                error_message = "Image generation quota exceeded. Please check your OpenAI billing settings."
-            elif "api_key" in error_str or "authentication" in error_str or "invalid_api_key" in error_str:
-                error_message = "API authentication failed. Please verify your OpenAI API key."
-            elif "content_policy" in error_str or "safety" in error_str or "rejected" in error_str:
-                error_message = "I can't generate images of real people (like politicians or celebrities) due to content policy. Please try describing a fictional character, a scene, or an abstract concept instead!"
-            elif "timeout" in error_str:
-                error_message = "Image generation timed out. Please try again."
-            elif "rate_limit" in error_str:
-                error_message = "Too many requests. Please wait a moment and try again."
-            else:
-                error_message = f"Image generation failed: {str(e)}"
+            return self._image_error(e, prompt)
 
-            return {
-                "error": error_message,
-                "prompt": prompt,
-                "success": False,
-                "timestamp": datetime.now().isoformat()
-            }
+        return self._image_success(response.data[0].url, prompt, enhanced_prompt)
+
+    def _enhance_image_prompt(self, prompt: str) -> str:
+        """Enhance the prompt with brand context if available."""
+        parts = [prompt, "."]
+        if self.brand_context:
+            brand_dna = self.brand_context.get('brand_dna', {})
+            tone = brand_dna.get('tone', 'professional')
+            values = brand_dna.get('values', [])
+            parts.append(f" The style should be {tone}")
+            if values:
+                parts.append(f" and reflect values of {', '.join(values[:2])}")
+
+        parts.append(". High quality, professional social media post design.")
+        return "".join(parts)
+
+    def _image_success(self, image_url: str, prompt: str, enhanced_prompt: str) -> Dict:
+        return {
+            "image_url": image_url,
+            "prompt": prompt,
+            "enhanced_prompt": enhanced_prompt,
+            "timestamp": datetime.now().isoformat(),
+            "success": True
+        }
+
+    def _image_error(self, e: Exception, prompt: str) -> Dict:
+        """Turn a DALL-E failure into a user-friendly error result."""
+        # Log the actual error for debugging (called from the except block)
+        logger.exception("DALL-E generation failed")
+
+        # Provide more specific error messages
+        error_str = str(e).lower()
+        if "billing" in error_str or "quota" in error_str or "insufficient_quota" in error_str:
+            error_message = "Image generation quota exceeded. Please check your OpenAI billing settings."
+        elif "api_key" in error_str or "authentication" in error_str or "invalid_api_key" in error_str:
+            error_message = "API authentication failed. Please verify your OpenAI API key."
+        elif "content_policy" in error_str or "safety" in error_str or "rejected" in error_str:
+            error_message = "I can't generate images of real people (like politicians or celebrities) due to content policy. Please try describing a fictional character, a scene, or an abstract concept instead!"
+        elif "timeout" in error_str:
+            error_message = "Image generation timed out. Please try again."
+        elif "rate_limit" in error_str:
+            error_message = "Too many requests. Please wait a moment and try again."
+        else:
+            error_message = f"Image generation failed: {str(e)}"
+
+        return {
+            "error": error_message,
+            "prompt": prompt,
+            "success": False,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def _persist_image(self, image_url: str, history_entry: Dict):
+        """
+        Download a generated image into the outputs directory before its URL expires.
+
+        On success the history entry gets a ``local_image_url`` served from /outputs.
+        """
+        filename = f"{uuid.uuid4().hex}.png"
+        relative_path = f"images/{self.session_id}/{filename}"
+        filepath = os.path.join(settings.output_dir, "images", self.session_id, filename)
+
+        try:
+            response = await _get_async_httpx().get(image_url)
+            response.raise_for_status()
+
+            def write_file():
+                self._ensure_dir(os.path.dirname(filepath))
+                with open(filepath, 'wb') as f:
+                    f.write(response.content)
+
+            await asyncio.to_thread(write_file)
+            history_entry["local_image_url"] = f"/outputs/{relative_path}"
+
+        except Exception:
+            logger.exception("Failed to save generated image %s", image_url)
 
     def generate_instagram_posts(self, topic: str, count: int = 5) -> List[Dict]:
         """
@@ -487,7 +926,7 @@ Respond with ONLY the hashtags, space-separated."""
             count: Number of posts to generate
 
         Returns:
-            List of post dicts with caption, hashtags, best_time
+            List of post dicts with caption, hashtags (list), best_time, content_type
         """
         prompt = f"""Create {count} Instagram post captions for {self.brand_handle} about: {topic}
 
@@ -495,56 +934,28 @@ For each post, provide:
 1. Engaging caption (150-200 characters)
 2. Relevant hashtags (5-8 hashtags)
 3. Best posting time
-4. Content type suggestion (carousel, reel, static image)
+4. Content type (carousel, reel, or static)
 
 Make sure captions match the brand voice and tone. Include call-to-actions."""
 
         try:
             response = self.openai_client.chat.completions.create(
-                model="gpt-4-turbo-preview",
+                model="gpt-4o",
                 messages=[
-                    {"role": "system", "content": self._build_system_prompt()},
+                    *self._system_messages(),
                     {"role": "user", "content": prompt}
                 ],
+                response_format=_INSTAGRAM_POSTS_FORMAT,
                 temperature=0.8,
                 max_tokens=2000
             )
 
-            content = response.choices[0].message.content
-
-            # Parse the response into structured posts
-            posts = self._parse_instagram_posts(content)
-            return posts
+            # Structured output - the response is guaranteed to match the schema
+            return json.loads(response.choices[0].message.content)["posts"]
 
         except Exception as e:
             return [{"error": str(e), "caption": "Error generating posts"}]
 
-    def _parse_instagram_posts(self, ai_response: str) -> List[Dict]:
-        """Parse AI response into structured post objects."""
-        posts = []
-        lines = ai_response.split('\n')
-
-        current_post = {}
-        for line in lines:
-            line = line.strip()
-            if line.startswith('Post ') or line.startswith('**Post'):
-                if current_post:
-                    posts.append(current_post)
-                current_post = {}
-            elif 'caption:' in line.lower():
-                current_post['caption'] = line.split(':', 1)[1].strip()
-            elif 'hashtag' in line.lower():
-                current_post['hashtags'] = line.split(':', 1)[1].strip()
-            elif 'time' in line.lower() or 'posting' in line.lower():
-                current_post['best_time'] = line.split(':', 1)[1].strip()
-            elif 'type' in line.lower():
-                current_post['content_type'] = line.split(':', 1)[1].strip()
-
-        if current_post:
-            posts.append(current_post)
-
-        return posts if posts else [{"caption": ai_response, "hashtags": "", "best_time": "Peak hours", "content_type": "Static"}]
-
     def predict_engagement(self, content_idea: str, platform: str = "Instagram") -> Dict:
         """
         Predict engagement for a content idea.
@@ -570,9 +981,9 @@ Base predictions on brand DNA and typical audience behavior for {self.brand_hand
 
         try:
             response = self.openai_client.chat.completions.create(
-                model="gpt-4-turbo-preview",
+                model="gpt-4o",
                 messages=[
-                    {"role": "system", "content": self._build_system_prompt()},
+                    *self._system_messages(),
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.6,
@@ -622,18 +1033,16 @@ Provide:
 Make it actionable and specific to the brand's DNA and audience."""
 
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4-turbo-preview",
+            campaign = self._complete_streamed(
+                model="gpt-4o",
                 messages=[
-                    {"role": "system", "content": self._build_system_prompt()},
+                    *self._system_messages(),
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
                 max_tokens=2500
             )
 
-            campaign = response.choices[0].message.content
-
             return {
                 "campaign": campaign,
                 "goal": goal,
@@ -681,9 +1090,9 @@ Be specific and actionable."""
 
         try:
             response = self.openai_client.chat.completions.create(
-                model="gpt-4-turbo-preview",
+                model="gpt-4o",
                 messages=[
-                    {"role": "system", "content": self._build_system_prompt()},
+                    *self._system_messages(),
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
@@ -702,6 +1111,7 @@ Be specific and actionable."""
         except Exception as e:
             return {"error": str(e), "analysis": "Unable to analyze competitor"}
 
+    @cached_response("personas")
     def get_audience_personas(self) -> Dict:
         """
         Get detailed audience micro-personas.
@@ -709,6 +1119,26 @@ Be specific and actionable."""
         Returns:
             Dict with 4 detailed personas
         """
+        try:
+            response = self.openai_client.chat.completions.create(**self._personas_params())
+            return self._personas_result(response.choices[0].message.content)
+
+        except Exception as e:
+            return {"error": str(e), "personas": "Unable to generate personas"}
+
+    @cached_response("personas")
+    @coalesce("personas")
+    async def get_audience_personas_async(self) -> Dict:
+        """Async variant of get_audience_personas (concurrent duplicates share one call)."""
+        try:
+            response = await _get_async_openai().chat.completions.create(**self._personas_params())
+            return self._personas_result(response.choices[0].message.content)
+
+        except Exception as e:
+            return {"error": str(e), "personas": "Unable to generate personas"}
+
+    def _personas_params(self) -> Dict:
+        """Completion parameters for the audience personas request."""
         prompt = f"""Create 4 detailed audience micro-personas for {self.brand_handle}:
 
 For each persona, provide:
@@ -722,28 +1152,24 @@ For each persona, provide:
 
 Make them realistic and actionable for targeted marketing."""
 
-        try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": self._build_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-
-            personas = response.choices[0].message.content
-
-            return {
-                "personas": personas,
-                "brand": self.brand_handle,
-                "created": datetime.now().isoformat()
-            }
+        return {
+            "model": "gpt-4o",
+            "messages": [
+                *self._system_messages(),
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 2000
+        }
 
-        except Exception as e:
-            return {"error": str(e), "personas": "Unable to generate personas"}
+    def _personas_result(self, personas: str) -> Dict:
+        return {
+            "personas": personas,
+            "brand": self.brand_handle,
+            "created": datetime.now().isoformat()
+        }
 
+    @cached_response("weekly_strategy")
     def weekly_content_strategy(self) -> Dict:
         """
         Generate a week-long content strategy.
@@ -751,9 +1177,48 @@ Make them realistic and actionable for targeted marketing."""
         Returns:
             Dict with day-by-day content plan
         """
+        try:
+            return _drain(self.weekly_content_strategy_stream())
+
+        # The SDK does not wrap transport errors raised while iterating a stream
+        except (OpenAIError, httpx.HTTPError) as e:
+            return {"error": str(e), "weekly_plan": "Unable to generate strategy"}
+
+    @cached_response("weekly_strategy")
+    @coalesce("weekly_strategy")
+    async def weekly_content_strategy_async(self) -> Dict:
+        """Async variant of weekly_content_strategy (concurrent duplicates share one call)."""
+        client = _get_async_openai().with_options(max_retries=self.WEEKLY_STRATEGY_MAX_RETRIES)
+        try:
+            response = await client.chat.completions.create(**self._weekly_strategy_params())
+            return self._weekly_strategy_result(response.choices[0].message.content)
+
+        except OpenAIError as e:
+            return {"error": str(e), "weekly_plan": "Unable to generate strategy"}
+
+    def weekly_content_strategy_stream(self) -> Generator[str, None, Dict]:
+        """
+        Stream a week-long content strategy as it is generated.
+
+        Yields:
+            Chunks of the strategy text
+
+        Returns:
+            Dict with day-by-day content plan (the generator's return value)
+        """
+        chunks = []
+        client = self.openai_client.with_options(max_retries=self.WEEKLY_STRATEGY_MAX_RETRIES)
+        for delta in self._stream_completion(client, **self._weekly_strategy_params()):
+            chunks.append(delta)
+            yield delta
+
+        return self._weekly_strategy_result("".join(chunks))
+
+    def _weekly_strategy_params(self) -> Dict:
+        """Completion parameters for the weekly content strategy request."""
         prompt = f"""Create a 7-day content strategy for {self.brand_handle}:
 
-For each day (Monday-Sunday), provide:
+For each day of the coming week (Monday-Sunday), provide:
 1. Content Theme/Topic
 2. Platform (Instagram/LinkedIn/Twitter/etc.)
 3. Content Format (Reel/Carousel/Story/Post)
@@ -763,36 +1228,84 @@ For each day (Monday-Sunday), provide:
 
 Make sure there's variety in content types and themes. Align with brand DNA and audience preferences."""
 
-        try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": self._build_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2500
-            )
-
-            strategy = response.choices[0].message.content
-
-            return {
-                "weekly_plan": strategy,
-                "brand": self.brand_handle,
-                "created": datetime.now().isoformat()
-            }
+        messages = [
+            *self._system_messages(),
+            self._build_volatile_prompt(),
+            {"role": "user", "content": prompt}
+        ]
+        return {
+            "model": "gpt-4o",
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": _fit_max_tokens("gpt-4o", messages, 2500)
+        }
 
-        except Exception as e:
-            return {"error": str(e), "weekly_plan": "Unable to generate strategy"}
+    def _weekly_strategy_result(self, strategy: str) -> Dict:
+        return {
+            "weekly_plan": strategy,
+            "brand": self.brand_handle,
+            "created": datetime.now().isoformat()
+        }
 
     def get_conversation_history(self) -> List[Dict]:
-        """Get full conversation history."""
-        return self.conversation_history
+        """Get the conversation history (up to MAX_STORED_MESSAGES most recent messages)."""
+        return list(self.conversation_history)
 
     def clear_conversation(self):
         """Clear conversation history for new session."""
-        self.conversation_history = []
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._start_session()
+
+    def _start_session(self):
+        """Reset history and open a new session with its own JSONL log."""
+        self.conversation_history = deque(maxlen=self.MAX_STORED_MESSAGES)
+        # Timestamp keeps logs sortable; the random suffix keeps sessions started
+        # in the same second (other users, clear_conversation) in separate files
+        self.session_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:12]}"
+        self._jsonl_path = f"conversations/conversation_{self._file_handle}_{self.session_id}.jsonl"
+
+    @property
+    def _file_handle(self) -> str:
+        """Brand handle reduced to characters that are safe in a filename."""
+        return _UNSAFE_FILENAME_RE.sub('_', self.brand_handle).strip('_') or "brand"
+
+    @classmethod
+    def _ensure_dir(cls, directory: str):
+        """Create directory once per process instead of stat-ing it on every write."""
+        if directory and directory not in cls._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            cls._ensured_dirs.add(directory)
+
+    def _record(self, role: str, content: str, timestamp: str, **extra) -> Dict:
+        """
+        Append a message to the conversation history and the session's JSONL log.
+
+        The log is append-only, so each turn costs one small write instead of
+        re-serializing the whole transcript. When called on the event loop the
+        write is handed to a background thread so the loop never blocks on disk.
+        """
+        message = {"role": role, "content": content, "timestamp": timestamp, **extra}
+        self.conversation_history.append(message)
+
+        # Serialize now: the message may be updated in place before a deferred write runs
+        line = _json_line(message)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._append_log(self._jsonl_path, line)
+        else:
+            _LOG_WRITER.submit(self._append_log, self._jsonl_path, line)
+
+        return message
+
+    @classmethod
+    def _append_log(cls, path: str, line: bytes):
+        """Append one serialized line to a conversation log."""
+        try:
+            cls._ensure_dir(os.path.dirname(path))
+            with open(path, 'ab') as f:
+                f.write(line)
+        except OSError:
+            logger.exception("Could not append to conversation log %s", path)
 
     def export_conversation(self, filepath: str = None) -> str:
         """
@@ -805,19 +1318,40 @@ Make sure there's variety in content types and themes. Align with brand DNA and
             Path to exported file
         """
         if not filepath:
-            filepath = f"conversations/conversation_{self.brand_handle}_{self.session_id}.json"
+            filepath = f"conversations/conversation_{self._file_handle}_{self.session_id}.json"
 
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        self._ensure_dir(os.path.dirname(filepath))
 
         export_data = {
             "brand_handle": self.brand_handle,
             "session_id": self.session_id,
-            "conversation": self.conversation_history,
+            "conversation": list(self.conversation_history),
             "brand_context": self.brand_context,
             "exported_at": datetime.now().isoformat()
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            payload = orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(export_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+        # Pre-encoded bytes through a 1 MB buffer: no text layer, few write syscalls
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            f.write(payload)
 
         return filepath
+
+
+async def batch_weekly_content_strategy(assistants: List[PixaroBrandAssistant]) -> List[Dict]:
+    """
+    Generate weekly content strategies for several brands concurrently.
+
+    Total wall time is roughly that of the slowest brand instead of the sum.
+
+    Args:
+        assistants: One assistant per brand
+
+    Returns:
+        Strategy dicts in the same order as ``assistants``
+    """
+    return await asyncio.gather(*(assistant.weekly_content_strategy_async() for assistant in assistants))
@@ -35,6 +35,8 @@ class Settings(BaseSettings):
     # Storage Configuration
     upload_dir: str = "./uploads"
     output_dir: str = "./outputs"
+    report_cache_dir: str = "./cache/reports"  # Not under output_dir (publicly served)
+    report_cache_max_entries: int = 64
     max_file_size: int = 10485760  # 10MB
 
     # Processing Configuration
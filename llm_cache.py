@@ -0,0 +1,201 @@
+"""
+LLM Response Cache - In-memory cache for repeated OpenAI completions
+Lets repeat requests from the same brand skip the API round-trip entirely,
+and lets concurrent identical requests share a single in-flight call
+"""
+
+import asyncio
+import inspect
+import re
+import time
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_prompt(text: str) -> str:
+    """Lowercase and collapse whitespace so trivially different prompts share a key."""
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def _is_not_error(result: Any) -> bool:
+    """Default cache filter: never store error payloads."""
+    return not (isinstance(result, dict) and "error" in result)
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache with a per-entry time-to-live.
+
+    Thread-safe, since FastAPI runs sync endpoints and background tasks
+    in a worker thread pool.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value) for key, evicting it if expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable):
+        """Drop the entry for key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# One cache per namespace, so sync and async variants of a method share entries
+_CACHES: Dict[str, ResponseCache] = {}
+
+
+def _make_key(namespace: str, instance: Any, args: tuple, kwargs: dict) -> Hashable:
+    """Build a cache key scoped to the assistant's brand."""
+    normalized_args = tuple(normalize_prompt(a) if isinstance(a, str) else a for a in args)
+    normalized_kwargs = tuple(sorted(
+        (k, normalize_prompt(v) if isinstance(v, str) else v) for k, v in kwargs.items()
+    ))
+    return (namespace, instance.brand_handle, normalized_args, normalized_kwargs)
+
+
+def _detached(value: Any) -> Any:
+    """Shallow-copy mutable results so callers never share the cached object."""
+    if isinstance(value, (dict, list, set)):
+        return value.copy()
+    return value
+
+
+def cached_response(
+    namespace: str,
+    ttl: float = 3600,
+    maxsize: int = 256,
+    cache_if: Optional[Callable[[Any], bool]] = None
+):
+    """
+    Cache the result of an assistant method that calls the LLM.
+
+    The key includes ``self.brand_handle`` so one brand never receives another
+    brand's cached output. Results rejected by ``cache_if`` (fallbacks, error
+    payloads) are returned to the caller but not stored.
+
+    Args:
+        namespace: Unique name for the cached method
+        ttl: Seconds a cached response stays valid
+        maxsize: Maximum number of cached responses
+        cache_if: Predicate deciding whether a result may be cached
+
+    Returns:
+        Decorator for instance methods
+    """
+    should_cache = cache_if or _is_not_error
+
+    def decorator(func: Callable) -> Callable:
+        cache = _CACHES.setdefault(namespace, ResponseCache(maxsize=maxsize, ttl=ttl))
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                key = _make_key(namespace, self, args, kwargs)
+                hit, value = cache.get(key)
+                if hit:
+                    return _detached(value)
+
+                result = await func(self, *args, **kwargs)
+                if should_cache(result):
+                    cache.set(key, _detached(result))
+                return result
+
+            async_wrapper.cache = cache
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = _make_key(namespace, self, args, kwargs)
+            hit, value = cache.get(key)
+            if hit:
+                return _detached(value)
+
+            result = func(self, *args, **kwargs)
+            if should_cache(result):
+                cache.set(key, _detached(result))
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def coalesce(namespace: str):
+    """
+    Share one in-flight call between concurrent identical async calls.
+
+    The first caller for a key starts the real call as its own task; every
+    caller, the first included, awaits that task instead of issuing its own
+    API request, and receives a shallow copy of its result. Complements cached_response, which only helps once a call
+    has completed.
+
+    Args:
+        namespace: Unique name for the coalesced method
+
+    Returns:
+        Decorator for async instance methods
+    """
+    def decorator(func: Callable) -> Callable:
+        inflight: Dict[Hashable, asyncio.Task] = {}
+
+        def _finished(key: Hashable, task: asyncio.Task):
+            if inflight.get(key) is task:
+                del inflight[key]
+            if not task.cancelled():
+                task.exception()  # Mark retrieved when every caller has gone away
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = _make_key(namespace, self, args, kwargs)
+            task = inflight.get(key)
+            if task is None:
+                # Own task, so cancelling the first caller doesn't cancel the others
+                task = asyncio.ensure_future(func(self, *args, **kwargs))
+                inflight[key] = task
+                task.add_done_callback(lambda done, key=key: _finished(key, done))
+
+            # shield: a cancelled caller must not cancel the shared call;
+            # each caller gets its own copy of the shared result
+            return _detached(await asyncio.shield(task))
+
+        return wrapper
+
+    return decorator
@@ -10,8 +10,6 @@ from typing import Dict, List
 from openai import OpenAI
 from config import settings
 import json
-import importlib
-import sys
 
 
 class MarketGenomeEngine:
@@ -338,10 +336,8 @@ Return as JSON with detailed content pillars."""
 
         print(f"   Generating PREMIUM PDF report with visuals...")
 
-        # Force reload the report generator module to pick up any code changes
-        import report_generator_v2
-        if 'report_generator_v2' in sys.modules:
-            importlib.reload(report_generator_v2)
+        # Imported on first use so reportlab only loads once a report is requested
+        # (code changes are picked up by uvicorn's reloader, not per report)
         from report_generator_v2 import PixaroReportGenerator
 
         report_gen = PixaroReportGenerator()
@@ -5,9 +5,10 @@ Analyzes brands from real data and creates complete marketing DNA
 
 from fastapi import FastAPI, Form, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 import os
+import json
 import uuid
 from typing import Dict, Optional
 from pydantic import EmailStr, BaseModel
@@ -55,6 +56,7 @@ class ChatInitRequest(BaseModel):
 class ChatMessageRequest(BaseModel):
     session_id: str
     message: str
+    exclude_history: bool = False
 
 
 class ChatReportRequest(BaseModel):
@@ -451,6 +453,7 @@ async def send_chat_message(request: ChatMessageRequest):
     Args:
         session_id: Active chat session ID
         message: User's message/question
+        exclude_history: Answer from this message alone, without earlier turns
 
     Returns:
         AI response with action type and metadata
@@ -467,7 +470,7 @@ async def send_chat_message(request: ChatMessageRequest):
         session['last_activity'] = datetime.now().isoformat()
 
         # Get AI response
-        response_data = assistant.chat(request.message)
+        response_data = await assistant.chat_async(request.message, exclude_history=request.exclude_history)
 
         print(f"\n[{request.session_id[:8]}] User: {request.message[:50]}...")
         print(f"[{request.session_id[:8]}] AI: {response_data['response'][:50]}...")
@@ -488,6 +491,38 @@ async def send_chat_message(request: ChatMessageRequest):
         raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
 
 
+@app.post("/api/chat/stream")
+async def stream_chat_message(request: ChatMessageRequest):
+    """
+    Send a message to the brand AI assistant and stream the reply.
+
+    Args:
+        session_id: Active chat session ID
+        message: User's message/question
+        exclude_history: Answer from this message alone, without earlier turns
+
+    Returns:
+        Server-sent events, one JSON ``{"delta": ...}`` payload per chunk,
+        terminated by ``[DONE]``
+    """
+    if request.session_id not in chat_sessions:
+        raise HTTPException(status_code=404, detail="Session not found. Please initialize chat first.")
+
+    session = chat_sessions[request.session_id]
+    assistant = session['assistant']
+
+    # Update last activity
+    session['last_activity'] = datetime.now().isoformat()
+
+    def event_stream():
+        # Sync generator: Starlette iterates it in a worker thread
+        for delta in assistant.chat_stream(request.message, exclude_history=request.exclude_history):
+            yield f"data: {json.dumps({'delta': delta})}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/api/chat/generate-report")
 async def generate_chat_report(request: ChatReportRequest, background_tasks: BackgroundTasks):
     """
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr
+from typing import List, Literal, Optional
 from enum import Enum
 
 
@@ -33,3 +33,20 @@ class JobStatusResponse(BaseModel):
     enhanced_image_url: Optional[str] = None
     video_url: Optional[str] = None
     email_sent: bool = False
+
+
+class InstagramPost(BaseModel):
+    """Single generated Instagram post (OpenAI structured output)"""
+    model_config = ConfigDict(extra="forbid")
+
+    caption: str
+    hashtags: List[str]
+    best_time: str
+    content_type: Literal["carousel", "reel", "static"]
+
+
+class InstagramPosts(BaseModel):
+    """Structured output schema for generated Instagram posts"""
+    model_config = ConfigDict(extra="forbid")
+
+    posts: List[InstagramPost]
@@ -10,22 +10,100 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from reportlab.lib import colors
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from html import escape
+from io import BytesIO
+from itertools import islice
+import hashlib
+import logging
 import os
+import re
+import shutil
 from config import settings
 
 # Version 2.2 - Fixed contentStrategyFramework extraction and month handling
-print("=" * 80)
-print("[REPORT GENERATOR V2.2] Module loaded - ENHANCED DEBUG VERSION")
-print("=" * 80)
 import json
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Characters not allowed in report filenames (keeps letters, digits, space, - and _)
+_SAFE_BRAND_RE = re.compile(r'[^\w \-]+')
+
+# Keys skipped by the fallback walks (metrics get their own section, brand DNA is metadata)
+_SKIP_NESTED_ROADMAP_KEYS = frozenset({'key_metrics', 'metrics', 'kpis', 'tracking'})
+_SKIP_ROADMAP_KEYS = _SKIP_NESTED_ROADMAP_KEYS | {'Key Metrics to Track'}
+_SKIP_CS_KEYS = frozenset({'brandDNA', 'brand_dna', 'branddna'})
+
+
+@lru_cache(maxsize=256)
+def _pretty(key: str) -> str:
+    """Turn a snake_case data key into a display label (LLM key names repeat across reports)"""
+    return key.replace('_', ' ').title()
+
+
+def _joinable(value, sep: str = ', ') -> str:
+    """Render a string or any iterable of values as display text (never a Python repr)"""
+    if value is None:
+        return 'N/A'
+    if isinstance(value, str):
+        return value
+    try:
+        return sep.join(map(str, value))
+    except TypeError:
+        return str(value)
+
+
+def _esc(value) -> str:
+    """Escape &, < and > in LLM/user text before it is embedded in Paragraph markup"""
+    return escape(str(value), quote=False)
+
 
 class PixaroReportGenerator:
     """
     Generates professional PDF Marketing Genome Reports
     """
 
+    # Roadmap months as (section title, key variations); add a row to render another month
+    _MONTH_SPECS = (
+        ("Month 1: Foundation", ('Month 1 Priorities', 'month_1', 'month1', 'Month 1', '1', 'month_one')),
+        ("Month 2: Momentum", ('Month 2 Priorities', 'month_2', 'month2', 'Month 2', '2', 'month_two')),
+        ("Month 3: Scale", ('Month 3 Priorities', 'month_3', 'month3', 'Month 3', '3', 'month_three')),
+    )
+
+    # Key variations seen in LLM output, in lookup order
+    _METRIC_KEYS = ('Key Metrics to Track', 'key_metrics', 'metrics', 'kpis', 'tracking')
+    _NESTED_ROADMAP_KEYS = ('90-Day Growth Roadmap', 'roadmap', 'timeline')
+    _PILLAR_KEYS = ('contentPillars', 'content_pillars', 'pillars', 'themes', 'topics')
+    _PILLAR_NAME_KEYS = ('pillarName', 'name', 'pillar', 'theme', 'title')
+    _PILLAR_TOPIC_KEYS = ('topicClusters', 'topics', 'subtopics', 'topic_clusters')
+    _PILLAR_FORMAT_KEYS = ('contentFormats', 'formats')
+    _PILLAR_FREQUENCY_KEYS = ('postingFrequency', 'frequency')
+    _FORMAT_KEYS = ('content_formats', 'formats', 'content_types')
+    _FREQUENCY_KEYS = ('posting_frequency', 'frequency', 'schedule', 'posting_schedule')
+
+    # Output directories already created by this process
+    _output_dirs_created = set()
+
+    @staticmethod
+    def _first_present(d: dict, keys: tuple, default=None):
+        """Return the first truthy value among keys, like a chain of ``or``-ed gets"""
+        for key in keys:
+            value = d.get(key)
+            if value:
+                return value
+        return default
+
+    @staticmethod
+    def _pick(d: dict, keys: tuple, default=None):
+        """Return the value of the first key present in d, even if it is empty"""
+        for key in keys:
+            if key in d:
+                return d[key]
+        return default
+
     def __init__(self):
         self.primary_color = HexColor('#667eea')
         self.secondary_color = HexColor('#764ba2')
@@ -83,6 +161,105 @@ class PixaroReportGenerator:
             spaceAfter=6
         ))
 
+        # Label/value tables: bold label column, wrapped Paragraph values
+        self.label_value_table_style = TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 11),
+            ('TEXTCOLOR', (0, 0), (-1, -1), self.text_color),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 0),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4)
+        ])
+
+        self.styles.add(ParagraphStyle(
+            name='GenomeBrandName',
+            parent=self.styles['Normal'],
+            fontSize=20,
+            textColor=self.secondary_color,
+            alignment=TA_CENTER
+        ))
+
+        self.styles.add(ParagraphStyle(
+            name='GenomeDate',
+            parent=self.styles['Normal'],
+            fontSize=12,
+            textColor=self.text_color,
+            alignment=TA_CENTER
+        ))
+
+        self.styles.add(ParagraphStyle(
+            name='GenomePoweredBy',
+            parent=self.styles['Normal'],
+            fontSize=10,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        ))
+
+        self.styles.add(ParagraphStyle(
+            name='GenomeFooter',
+            parent=self.styles['Normal'],
+            fontSize=9,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        ))
+
+    def _label_value_table(self, rows: list) -> Table:
+        """Lay out (label, value) pairs as a single two-column table flowable"""
+        body = self.styles['GenomeBodyText']
+        return Table(
+            [[label, Paragraph(str(value), body)] for label, value in rows],
+            colWidths=[1.7*inch, 5.4*inch],
+            style=self.label_value_table_style,
+            hAlign='LEFT'
+        )
+
+    @staticmethod
+    def _flush_lines(elements: list, lines: list, style):
+        """Emit buffered label/value lines as one <br/>-joined Paragraph (one parse instead of N)"""
+        if lines:
+            elements.append(Paragraph("<br/>".join(lines), style))
+            lines.clear()
+
+    @staticmethod
+    def _link_or_copy(src: str, dst: str):
+        """Hard-link src to dst, copying when links are unsupported or dst exists"""
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    @classmethod
+    def generate_batch(cls, jobs: list, max_workers: int = None) -> list:
+        """
+        Generate several reports in parallel, one process per CPU core by default
+
+        PDF layout is CPU-bound pure Python, so threads would serialize on the GIL.
+
+        Args:
+            jobs: List of (genome_data, brand_input) tuples
+            max_workers: Maximum number of worker processes
+
+        Returns:
+            Paths to generated PDF files, in the same order as jobs
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_generate_report_job, jobs))
+
+    @staticmethod
+    def _prune_report_cache(cache_dir: str, max_entries: int):
+        """Delete the least recently used cached PDFs beyond max_entries"""
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith('.pdf')]
+        if len(entries) <= max_entries:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[max_entries:]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass  # Pruned concurrently by another worker
+
     def generate_report(self, genome_data: dict, brand_input: str) -> str:
         """
         Generate the Marketing Genome Report PDF
@@ -94,18 +271,43 @@ class PixaroReportGenerator:
         Returns:
             Path to generated PDF file
         """
-        # Create output filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_brand = "".join(c for c in brand_input if c.isalnum() or c in (' ', '-', '_')).strip()[:30]
+        # Create output filename (one clock read shared with the title page)
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        safe_brand = _SAFE_BRAND_RE.sub('', brand_input).strip()[:30]
         filename = f"MarketingGenome_{safe_brand}_{timestamp}.pdf"
         filepath = os.path.join(settings.output_dir, filename)
 
-        # Ensure output directory exists
-        os.makedirs(settings.output_dir, exist_ok=True)
-
-        # Create PDF document
+        # Ensure output and cache directories exist (once per process). The cache
+        # lives outside output_dir, which is publicly served under /outputs
+        cache_dir = settings.report_cache_dir
+        for directory in (settings.output_dir, cache_dir):
+            if directory not in PixaroReportGenerator._output_dirs_created:
+                os.makedirs(directory, exist_ok=True)
+                PixaroReportGenerator._output_dirs_created.add(directory)
+
+        # Identical data for the same brand on the same day renders an identical PDF
+        # (the title page shows the date), so reuse it instead of rebuilding
+        cache_key = hashlib.blake2b(
+            json.dumps([genome_data, brand_input, now.strftime('%Y-%m-%d')], sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        cache_path = os.path.join(cache_dir, f"{cache_key}.pdf")
+        try:
+            self._link_or_copy(cache_path, filepath)
+        except FileNotFoundError:
+            pass  # Not cached, or pruned by another worker - build it below
+        else:
+            try:
+                os.utime(cache_path)  # Recently used entries survive pruning
+            except FileNotFoundError:
+                pass
+            return filepath
+
+        # Create PDF document (laid out in memory, written to disk in one go)
+        buffer = BytesIO()
         doc = SimpleDocTemplate(
-            filepath,
+            buffer,
             pagesize=letter,
             rightMargin=50,
             leftMargin=50,
@@ -117,7 +319,7 @@ class PixaroReportGenerator:
         story = []
 
         # Title Page
-        story.extend(self._create_title_page(brand_input))
+        story.extend(self._create_title_page(brand_input, now))
         story.append(PageBreak())
 
         # Executive Summary
@@ -141,10 +343,23 @@ class PixaroReportGenerator:
 
         # Build PDF
         doc.build(story)
+        with open(filepath, 'wb') as f:
+            f.write(buffer.getbuffer())
+
+        # Cache a separate copy, so deleting served reports still frees their space
+        try:
+            # Write then rename, so other workers never link a half-written entry
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(buffer.getbuffer())
+            os.replace(tmp_path, cache_path)
+            self._prune_report_cache(cache_dir, settings.report_cache_max_entries)
+        except OSError:
+            logger.warning("Could not cache report %s", filepath, exc_info=True)
 
         return filepath
 
-    def _create_title_page(self, brand_input: str) -> list:
+    def _create_title_page(self, brand_input: str, generated_at: datetime) -> list:
         """Create the title page"""
         elements = []
 
@@ -160,28 +375,16 @@ class PixaroReportGenerator:
 
         # Brand name
         elements.append(Paragraph(
-            f"<b>{brand_input}</b>",
-            ParagraphStyle(
-                'BrandName',
-                parent=self.styles['Normal'],
-                fontSize=20,
-                textColor=self.secondary_color,
-                alignment=TA_CENTER
-            )
+            f"<b>{_esc(brand_input)}</b>",
+            self.styles['GenomeBrandName']
         ))
 
         elements.append(Spacer(1, inch))
 
         # Date
         elements.append(Paragraph(
-            f"Generated: {datetime.now().strftime('%B %d, %Y')}",
-            ParagraphStyle(
-                'Date',
-                parent=self.styles['Normal'],
-                fontSize=12,
-                textColor=self.text_color,
-                alignment=TA_CENTER
-            )
+            f"Generated: {generated_at.strftime('%B %d, %Y')}",
+            self.styles['GenomeDate']
         ))
 
         elements.append(Spacer(1, 0.5*inch))
@@ -189,13 +392,7 @@ class PixaroReportGenerator:
         # Powered by
         elements.append(Paragraph(
             "Powered by Genome AI",
-            ParagraphStyle(
-                'PoweredBy',
-                parent=self.styles['Normal'],
-                fontSize=10,
-                textColor=colors.grey,
-                alignment=TA_CENTER
-            )
+            self.styles['GenomePoweredBy']
         ))
 
         return elements
@@ -210,83 +407,92 @@ class PixaroReportGenerator:
         brand_dna = genome_data.get('brand_dna', {})
         positioning = brand_dna.get('positioning', {})
 
-        summary_text = f"""
-        This Marketing Genome Report provides a comprehensive analysis of <b>{brand_input}</b>,
-        including brand DNA extraction, competitive intelligence, growth strategies, and content recommendations.
-        """
-        elements.append(Paragraph(summary_text, self.styles['GenomeBodyText']))
-
-        # Key highlights
-        elements.append(Paragraph("Key Highlights:", self.styles['GenomeSubHeader']))
-
         highlights = [
             f"Market Position: {positioning.get('market_position', 'N/A')}",
             f"Unique Value Proposition: {positioning.get('uvp', 'N/A')}",
             f"Primary Differentiation: {positioning.get('differentiation', 'N/A')}"
         ]
 
-        for highlight in highlights:
-            elements.append(Paragraph(f"• {highlight}", self.styles['GenomeBulletText']))
+        # Summary and key highlights as one Paragraph (parsed once)
+        summary_lines = [
+            f"This Marketing Genome Report provides a comprehensive analysis of <b>{_esc(brand_input)}</b>, "
+            "including brand DNA extraction, competitive intelligence, growth strategies, and content recommendations.",
+            "",
+            "<b>Key Highlights:</b>",
+            *(f"• {_esc(highlight)}" for highlight in highlights)
+        ]
+        elements.append(Paragraph("<br/>".join(summary_lines), self.styles['GenomeBodyText']))
 
         return elements
 
     def _create_brand_dna_section(self, brand_dna: dict) -> list:
         """Create brand DNA section"""
+        body = self.styles['GenomeBodyText']
+        sub = self.styles['GenomeSubHeader']
+        bullet = self.styles['GenomeBulletText']
         elements = []
 
         elements.append(Paragraph("Brand DNA Analysis", self.styles['GenomeSectionHeader']))
 
         # Personality
         personality = brand_dna.get('personality', {})
-        elements.append(Paragraph("Brand Personality", self.styles['GenomeSubHeader']))
+        elements.append(Paragraph("Brand Personality", sub))
 
-        elements.append(Paragraph(f"<b>Tone:</b> {personality.get('tone', 'N/A')}", self.styles['GenomeBodyText']))
+        personality_rows = [("Tone:", personality.get('tone', 'N/A'))]
 
         values = personality.get('values', [])
         if values:
-            values_str = ', '.join(values) if isinstance(values, list) else str(values)
-            elements.append(Paragraph(f"<b>Core Values:</b> {values_str}", self.styles['GenomeBodyText']))
+            values_str = _joinable(values)
+            personality_rows.append(("Core Values:", values_str))
 
-        elements.append(Paragraph(f"<b>Brand Archetype:</b> {personality.get('archetype', 'N/A')}", self.styles['GenomeBodyText']))
+        personality_rows.append(("Brand Archetype:", personality.get('archetype', 'N/A')))
+        elements.append(self._label_value_table(personality_rows))
 
         # Positioning
         positioning = brand_dna.get('positioning', {})
-        elements.append(Paragraph("Market Positioning", self.styles['GenomeSubHeader']))
+        elements.append(Paragraph("Market Positioning", sub))
 
-        elements.append(Paragraph(f"<b>Position:</b> {positioning.get('market_position', 'N/A')}", self.styles['GenomeBodyText']))
-        elements.append(Paragraph(f"<b>UVP:</b> {positioning.get('uvp', 'N/A')}", self.styles['GenomeBodyText']))
-        elements.append(Paragraph(f"<b>Differentiation:</b> {positioning.get('differentiation', 'N/A')}", self.styles['GenomeBodyText']))
+        elements.append(self._label_value_table([
+            ("Position:", positioning.get('market_position', 'N/A')),
+            ("UVP:", positioning.get('uvp', 'N/A')),
+            ("Differentiation:", positioning.get('differentiation', 'N/A'))
+        ]))
 
         # Audience
         audience = brand_dna.get('audience', {})
-        elements.append(Paragraph("Target Audience", self.styles['GenomeSubHeader']))
+        elements.append(Paragraph("Target Audience", sub))
 
-        elements.append(Paragraph(f"<b>Demographics:</b> {audience.get('demographics', 'N/A')}", self.styles['GenomeBodyText']))
-        elements.append(Paragraph(f"<b>Psychographics:</b> {audience.get('psychographics', 'N/A')}", self.styles['GenomeBodyText']))
+        elements.append(self._label_value_table([
+            ("Demographics:", audience.get('demographics', 'N/A')),
+            ("Psychographics:", audience.get('psychographics', 'N/A'))
+        ]))
 
         pain_points = audience.get('pain_points', [])
         if pain_points:
-            elements.append(Paragraph("<b>Pain Points Addressed:</b>", self.styles['GenomeBodyText']))
-            for point in pain_points[:5]:
-                elements.append(Paragraph(f"• {point}", self.styles['GenomeBulletText']))
+            elements.append(Paragraph("<b>Pain Points Addressed:</b>", body))
+            elements.extend(Paragraph(f"• {point}", bullet) for point in pain_points[:5])
 
         # Messaging
         messaging = brand_dna.get('messaging', {})
-        elements.append(Paragraph("Messaging Strategy", self.styles['GenomeSubHeader']))
+        elements.append(Paragraph("Messaging Strategy", sub))
 
-        elements.append(Paragraph(f"<b>Communication Style:</b> {messaging.get('style', 'N/A')}", self.styles['GenomeBodyText']))
-        elements.append(Paragraph(f"<b>Emotional Appeal:</b> {messaging.get('emotional_appeal', 'N/A')}", self.styles['GenomeBodyText']))
+        elements.append(self._label_value_table([
+            ("Communication Style:", messaging.get('style', 'N/A')),
+            ("Emotional Appeal:", messaging.get('emotional_appeal', 'N/A'))
+        ]))
 
         key_messages = messaging.get('key_messages', [])
         if key_messages:
-            elements.append(Paragraph("<b>Key Messages:</b>", self.styles['GenomeBodyText']))
-            for msg in key_messages[:5]:
-                elements.append(Paragraph(f"• {msg}", self.styles['GenomeBulletText']))
+            elements.append(Paragraph("<b>Key Messages:</b>", body))
+            elements.extend(Paragraph(f"• {msg}", bullet) for msg in key_messages[:5])
 
         return elements
 
     def _create_competitor_section(self, competitors: dict) -> list:
         """Create competitor analysis section"""
+        body = self.styles['GenomeBodyText']
+        sub = self.styles['GenomeSubHeader']
+        bullet = self.styles['GenomeBulletText']
         elements = []
 
         elements.append(Paragraph("Competitive Intelligence", self.styles['GenomeSectionHeader']))
@@ -294,318 +500,305 @@ class PixaroReportGenerator:
         # Competitors list
         competitor_list = competitors.get('competitors', [])
         if competitor_list:
-            elements.append(Paragraph("Key Competitors", self.styles['GenomeSubHeader']))
+            elements.append(Paragraph("Key Competitors", sub))
 
-            for comp in competitor_list[:5]:
-                if isinstance(comp, dict):
-                    name = comp.get('name', 'Unknown')
-                    weakness = comp.get('weakness', 'N/A')
-                    elements.append(Paragraph(f"<b>{name}</b>", self.styles['GenomeBodyText']))
-                    elements.append(Paragraph(f"Weakness: {weakness}", self.styles['GenomeBulletText']))
-                    elements.append(Spacer(1, 0.1*inch))
+            # Names go in Paragraphs so long ones wrap inside the label column
+            competitor_rows = [
+                (Paragraph(f"<b>{_esc(comp.get('name', 'Unknown'))}</b>", body), f"Weakness: {_esc(comp.get('weakness', 'N/A'))}")
+                for comp in competitor_list[:5] if isinstance(comp, dict)
+            ]
+            if competitor_rows:
+                elements.append(self._label_value_table(competitor_rows))
+                elements.append(Spacer(1, 0.1*inch))
 
         # Market gaps
         gaps = competitors.get('market_gaps', [])
         if gaps:
-            elements.append(Paragraph("Market Gaps & Opportunities", self.styles['GenomeSubHeader']))
-            for gap in gaps[:5]:
-                elements.append(Paragraph(f"• {gap}", self.styles['GenomeBulletText']))
+            elements.append(Paragraph("Market Gaps & Opportunities", sub))
+            elements.extend(Paragraph(f"• {gap}", bullet) for gap in gaps[:5])
 
         # Competitive advantages
         advantages = competitors.get('competitive_advantages', [])
         if advantages:
-            elements.append(Paragraph("Your Competitive Advantages", self.styles['GenomeSubHeader']))
-            for adv in advantages[:5]:
-                elements.append(Paragraph(f"• {adv}", self.styles['GenomeBulletText']))
+            elements.append(Paragraph("Your Competitive Advantages", sub))
+            elements.extend(Paragraph(f"• {adv}", bullet) for adv in advantages[:5])
 
         return elements
 
     def _create_growth_roadmap_section(self, roadmap: dict) -> list:
         """Create growth roadmap section"""
+        body = self.styles['GenomeBodyText']
+        sub = self.styles['GenomeSubHeader']
+        bullet = self.styles['GenomeBulletText']
         elements = []
 
         elements.append(Paragraph("90-Day Growth Roadmap", self.styles['GenomeSectionHeader']))
 
-        # Debug: Print roadmap structure
-        print(f"[DEBUG] Roadmap keys: {list(roadmap.keys())}")
+        # Debug: Log roadmap structure (skipped entirely unless DEBUG is enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Roadmap keys: %s", list(roadmap.keys()))
 
-        # Print sample of Month 1 data to see its structure
-        month1_data = roadmap.get('Month 1 Priorities')
-        if month1_data:
-            print(f"[DEBUG] Month 1 Priorities type: {type(month1_data)}")
-            print(f"[DEBUG] Month 1 Priorities sample: {str(month1_data)[:200]}")
+            # Sample of Month 1 data to see its structure
+            month1_data = roadmap.get('Month 1 Priorities')
+            if month1_data:
+                logger.debug("Month 1 Priorities type: %s", type(month1_data))
+                logger.debug("Month 1 Priorities sample: %.200s", month1_data)
 
         # If roadmap is empty, show placeholder
         if not roadmap:
-            elements.append(Paragraph("Growth roadmap data is being generated...", self.styles['GenomeBodyText']))
+            elements.append(Paragraph("Growth roadmap data is being generated...", body))
             return elements
 
-        # Try multiple key variations for months
-        # Month 1
-        month1 = (roadmap.get('Month 1 Priorities') or roadmap.get('month_1') or roadmap.get('month1') or
-                  roadmap.get('Month 1') or roadmap.get('1') or
-                  roadmap.get('month_one') or {})
-        if month1:
-            elements.append(Paragraph("Month 1: Foundation", self.styles['GenomeSubHeader']))
-            self._add_month_content(elements, month1)
-
-        # Month 2
-        month2 = (roadmap.get('Month 2 Priorities') or roadmap.get('month_2') or roadmap.get('month2') or
-                  roadmap.get('Month 2') or roadmap.get('2') or
-                  roadmap.get('month_two') or {})
-        if month2:
-            elements.append(Paragraph("Month 2: Momentum", self.styles['GenomeSubHeader']))
-            self._add_month_content(elements, month2)
-
-        # Month 3
-        month3 = (roadmap.get('Month 3 Priorities') or roadmap.get('month_3') or roadmap.get('month3') or
-                  roadmap.get('Month 3') or roadmap.get('3') or
-                  roadmap.get('month_three') or {})
-        if month3:
-            elements.append(Paragraph("Month 3: Scale", self.styles['GenomeSubHeader']))
-            self._add_month_content(elements, month3)
+        # Try multiple key variations for each month. A month key that is present
+        # but empty still marks the roadmap as month-structured, so the raw-dict
+        # fallback below is skipped
+        found_month = False
+        for title, keys in self._MONTH_SPECS:
+            month = self._pick(roadmap, keys)
+            if month is None:
+                continue
+            found_month = True
+            if month:
+                elements.append(Paragraph(title, sub))
+                self._add_month_content(elements, month)
 
         # Key metrics - try multiple variations
-        metrics = (roadmap.get('Key Metrics to Track') or roadmap.get('key_metrics') or roadmap.get('metrics') or
-                   roadmap.get('kpis') or roadmap.get('tracking') or [])
+        metrics = self._first_present(roadmap, self._METRIC_KEYS, [])
         if metrics:
-            elements.append(Paragraph("Key Metrics to Track", self.styles['GenomeSubHeader']))
+            elements.append(Paragraph("Key Metrics to Track", sub))
             if isinstance(metrics, list):
-                for metric in metrics[:8]:
-                    elements.append(Paragraph(f"• {metric}", self.styles['GenomeBulletText']))
+                elements.extend(Paragraph(f"• {metric}", bullet) for metric in metrics[:8])
             elif isinstance(metrics, dict):
-                for key, value in list(metrics.items())[:8]:
-                    elements.append(Paragraph(f"• {key}: {value}", self.styles['GenomeBulletText']))
+                elements.extend(Paragraph(f"• {key}: {value}", bullet) for key, value in islice(metrics.items(), 8))
             elif isinstance(metrics, str):
-                elements.append(Paragraph(metrics, self.styles['GenomeBodyText']))
+                elements.append(Paragraph(metrics, body))
 
         # If no months were found, try to extract any content from the dict
-        if not month1 and not month2 and not month3:
+        if not found_month:
             # Check if there's a nested roadmap structure
-            nested_roadmap = (roadmap.get('90-Day Growth Roadmap') or roadmap.get('roadmap') or
-                            roadmap.get('timeline') or None)
+            nested_roadmap = self._first_present(roadmap, self._NESTED_ROADMAP_KEYS)
 
-            if nested_roadmap and isinstance(nested_roadmap, dict):
+            if nested_roadmap and type(nested_roadmap) is dict:
                 # Extract from nested structure
-                for key, value in list(nested_roadmap.items())[:10]:
-                    if key not in ['key_metrics', 'metrics', 'kpis', 'tracking']:
-                        if isinstance(value, str):
-                            elements.append(Paragraph(f"<b>{key.replace('_', ' ').title()}:</b>", self.styles['GenomeSubHeader']))
-                            elements.append(Paragraph(value, self.styles['GenomeBodyText']))
-                        elif isinstance(value, list):
-                            elements.append(Paragraph(f"<b>{key.replace('_', ' ').title()}:</b>", self.styles['GenomeSubHeader']))
-                            for item in value[:8]:
-                                if isinstance(item, str):
-                                    elements.append(Paragraph(f"  • {item}", self.styles['GenomeBulletText']))
-                        elif isinstance(value, dict):
-                            elements.append(Paragraph(f"<b>{key.replace('_', ' ').title()}:</b>", self.styles['GenomeSubHeader']))
-                            for sub_key, sub_val in list(value.items())[:5]:
-                                if isinstance(sub_val, str):
-                                    elements.append(Paragraph(f"  <b>{sub_key}:</b> {sub_val}", self.styles['GenomeBodyText']))
-                                elif isinstance(sub_val, list):
-                                    elements.append(Paragraph(f"  <b>{sub_key}:</b>", self.styles['GenomeBodyText']))
-                                    for item in sub_val[:3]:
-                                        elements.append(Paragraph(f"    • {item}", self.styles['GenomeBulletText']))
+                for key, value in islice(nested_roadmap.items(), 10):
+                    if key not in _SKIP_NESTED_ROADMAP_KEYS and type(value) in (str, list, dict):
+                        elements.append(Paragraph(f"<b>{_pretty(key)}:</b>", sub))
+                        if type(value) is str:
+                            elements.append(Paragraph(value, body))
+                        elif type(value) is list:
+                            elements.extend(Paragraph(f"  • {item}", bullet) for item in value[:8] if type(item) is str)
+                        else:
+                            lines = []
+                            for sub_key, sub_val in islice(value.items(), 5):
+                                if type(sub_val) is str:
+                                    lines.append(f"  <b>{sub_key}:</b> {sub_val}")
+                                elif type(sub_val) is list:
+                                    self._flush_lines(elements, lines, body)
+                                    elements.append(Paragraph(f"  <b>{sub_key}:</b>", body))
+                                    elements.extend(Paragraph(f"    • {item}", bullet) for item in sub_val[:3])
+                            self._flush_lines(elements, lines, body)
             else:
                 # Flat structure
-                elements.append(Paragraph("Growth Strategy Overview", self.styles['GenomeSubHeader']))
-                for key, value in list(roadmap.items())[:10]:
-                    if key not in ['key_metrics', 'metrics', 'kpis', 'tracking', 'Key Metrics to Track']:
-                        if isinstance(value, str):
-                            elements.append(Paragraph(f"<b>{key.replace('_', ' ').title()}:</b> {value}", self.styles['GenomeBodyText']))
-                        elif isinstance(value, list):
-                            elements.append(Paragraph(f"<b>{key.replace('_', ' ').title()}:</b>", self.styles['GenomeBodyText']))
-                            for item in value[:5]:
-                                if isinstance(item, str):
-                                    elements.append(Paragraph(f"  • {item}", self.styles['GenomeBulletText']))
+                elements.append(Paragraph("Growth Strategy Overview", sub))
+                lines = []
+                for key, value in islice(roadmap.items(), 10):
+                    if key not in _SKIP_ROADMAP_KEYS:
+                        if type(value) is str:
+                            lines.append(f"<b>{_pretty(key)}:</b> {value}")
+                        elif type(value) is list:
+                            self._flush_lines(elements, lines, body)
+                            elements.append(Paragraph(f"<b>{_pretty(key)}:</b>", body))
+                            elements.extend(Paragraph(f"  • {item}", bullet) for item in value[:5] if type(item) is str)
+                self._flush_lines(elements, lines, body)
 
         return elements
 
     def _add_month_content(self, elements: list, month_data):
         """Add month content to elements"""
-        print(f"[DEBUG] Month data type: {type(month_data)}")
-        print(f"[DEBUG] Month data value: {str(month_data)[:300]}")
-
-        if isinstance(month_data, list):
+        body = self.styles['GenomeBodyText']
+        bullet = self.styles['GenomeBulletText']
+        logger.debug("Month data type: %s", type(month_data))
+        logger.debug("Month data value: %.300s", month_data)
+
+        # Exact type checks: the data comes straight from json.loads, never subclasses
+        data_type = type(month_data)
+        if data_type is list:
             # Direct list of priorities
-            for item in month_data[:8]:
-                if isinstance(item, str):
-                    elements.append(Paragraph(f"  • {item}", self.styles['GenomeBulletText']))
-        elif isinstance(month_data, dict):
+            elements.extend(Paragraph(f"  • {item}", bullet) for item in month_data[:8] if type(item) is str)
+        elif data_type is dict:
             # Try to get priorities/actions list
             priorities = month_data.get('priorities', month_data.get('actions', []))
-            if priorities and isinstance(priorities, list):
-                for priority in priorities[:8]:
-                    if isinstance(priority, str):
-                        elements.append(Paragraph(f"  • {priority}", self.styles['GenomeBulletText']))
+            if priorities and type(priorities) is list:
+                elements.extend(Paragraph(f"  • {priority}", bullet) for priority in priorities[:8] if type(priority) is str)
             else:
                 # If no priorities key, iterate through all dict values
-                for key, value in list(month_data.items())[:8]:
-                    if isinstance(value, str):
-                        elements.append(Paragraph(f"  • {value}", self.styles['GenomeBulletText']))
-                    elif isinstance(value, list):
-                        elements.append(Paragraph(f"  <b>{key.replace('_', ' ').title()}:</b>", self.styles['GenomeBodyText']))
-                        for item in value[:5]:
-                            if isinstance(item, str):
-                                elements.append(Paragraph(f"    • {item}", self.styles['GenomeBulletText']))
-        elif isinstance(month_data, str):
-            elements.append(Paragraph(month_data, self.styles['GenomeBodyText']))
+                for key, value in islice(month_data.items(), 8):
+                    if type(value) is str:
+                        elements.append(Paragraph(f"  • {value}", bullet))
+                    elif type(value) is list:
+                        elements.append(Paragraph(f"  <b>{_pretty(key)}:</b>", body))
+                        elements.extend(Paragraph(f"    • {item}", bullet) for item in value[:5] if type(item) is str)
+        elif data_type is str:
+            elements.append(Paragraph(month_data, body))
 
         elements.append(Spacer(1, 0.1*inch))
 
     def _create_content_strategy_section(self, content_strategy: dict) -> list:
         """Create content strategy section"""
+        body = self.styles['GenomeBodyText']
+        sub = self.styles['GenomeSubHeader']
+        bullet = self.styles['GenomeBulletText']
         elements = []
 
         elements.append(Paragraph("Content Strategy Blueprint", self.styles['GenomeSectionHeader']))
 
-        # Debug: Print content strategy structure
-        print(f"[DEBUG] Content Strategy keys: {list(content_strategy.keys())}")
+        # Debug: Log content strategy structure (skipped unless DEBUG is enabled)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Content Strategy keys: %s", list(content_strategy.keys()))
 
-        # Print sample of contentPillars to see structure
-        pillars_data = content_strategy.get('contentPillars')
-        if pillars_data:
-            print(f"[DEBUG] contentPillars type: {type(pillars_data)}")
-            if isinstance(pillars_data, list) and len(pillars_data) > 0:
-                print(f"[DEBUG] First pillar type: {type(pillars_data[0])}")
-                print(f"[DEBUG] First pillar sample: {str(pillars_data[0])[:300]}")
+            # Sample of contentPillars to see structure
+            pillars_data = content_strategy.get('contentPillars')
+            if pillars_data:
+                logger.debug("contentPillars type: %s", type(pillars_data))
+                if isinstance(pillars_data, list) and len(pillars_data) > 0:
+                    logger.debug("First pillar type: %s", type(pillars_data[0]))
+                    logger.debug("First pillar sample: %.300s", pillars_data[0])
 
         # If content_strategy is empty, show placeholder
         if not content_strategy:
-            elements.append(Paragraph("Content strategy data is being generated...", self.styles['GenomeBodyText']))
+            elements.append(Paragraph("Content strategy data is being generated...", body))
             return elements
 
         # Content pillars - try multiple variations
         # First check if there's a nested framework structure
         framework = content_strategy.get('contentStrategyFramework')
         if framework and isinstance(framework, dict):
-            print(f"[DEBUG] Found contentStrategyFramework, extracting pillars from it")
+            logger.debug("Found contentStrategyFramework, extracting pillars from it")
             content_strategy = framework  # Use the framework as the main dict
 
         pillars = None
-        for key in ['contentPillars', 'content_pillars', 'pillars', 'themes', 'topics']:
+        for key in self._PILLAR_KEYS:
             if key in content_strategy:
                 pillars = content_strategy[key]
-                print(f"[DEBUG] Found pillars under key: {key}")
+                logger.debug("Found pillars under key: %s", key)
                 break
 
         # Debug pillars
-        print(f"[DEBUG] Pillars found: {pillars is not None}")
-        if pillars is not None:
-            print(f"[DEBUG] Pillars type: {type(pillars)}")
-            print(f"[DEBUG] Pillars value (first 500 chars): {str(pillars)[:500]}")
-            if isinstance(pillars, list):
-                print(f"[DEBUG] Number of pillars: {len(pillars)}")
-                if len(pillars) > 0:
-                    print(f"[DEBUG] First pillar type: {type(pillars[0])}")
-                    print(f"[DEBUG] First pillar: {pillars[0]}")
+        if debug:
+            logger.debug("Pillars found: %s", pillars is not None)
+            if pillars is not None:
+                logger.debug("Pillars type: %s", type(pillars))
+                logger.debug("Pillars value (first 500 chars): %.500s", pillars)
+                if isinstance(pillars, list):
+                    logger.debug("Number of pillars: %d", len(pillars))
+                    if len(pillars) > 0:
+                        logger.debug("First pillar type: %s", type(pillars[0]))
+                        logger.debug("First pillar: %s", pillars[0])
 
         if pillars is not None and pillars:
-            elements.append(Paragraph("Content Pillars", self.styles['GenomeSubHeader']))
+            elements.append(Paragraph("Content Pillars", sub))
 
             if isinstance(pillars, list):
                 for pillar in pillars[:5]:
                     if isinstance(pillar, dict):
-                        name = (pillar.get('pillarName') or pillar.get('name') or pillar.get('pillar') or
-                                pillar.get('theme') or pillar.get('title') or 'Content Pillar')
-                        elements.append(Paragraph(f"<b>{name}</b>", self.styles['GenomeBodyText']))
+                        name = self._first_present(pillar, self._PILLAR_NAME_KEYS, 'Content Pillar')
+                        elements.append(Paragraph(f"<b>{_esc(name)}</b>", body))
+                        pillar_rows = []
 
                         # Get topic clusters
-                        topics = (pillar.get('topicClusters') or pillar.get('topics') or
-                                  pillar.get('subtopics') or pillar.get('topic_clusters') or [])
+                        topics = self._first_present(pillar, self._PILLAR_TOPIC_KEYS, [])
                         if topics:
-                            elements.append(Paragraph("Topics:", self.styles['GenomeBodyText']))
-                            for topic in topics[:5]:
-                                elements.append(Paragraph(f"  • {topic}", self.styles['GenomeBulletText']))
+                            pillar_rows.append(("Topics:", "<br/>".join(f"• {_esc(topic)}" for topic in topics[:5])))
 
                         # Get content formats
-                        formats = pillar.get('contentFormats') or pillar.get('formats') or []
+                        formats = self._first_present(pillar, self._PILLAR_FORMAT_KEYS, [])
                         if formats:
-                            formats_str = ', '.join(formats) if isinstance(formats, list) else str(formats)
-                            elements.append(Paragraph(f"Formats: {formats_str}", self.styles['GenomeBodyText']))
+                            formats_str = _joinable(formats)
+                            pillar_rows.append(("Formats:", _esc(formats_str)))
 
                         # Get posting frequency
-                        freq = pillar.get('postingFrequency') or pillar.get('frequency')
+                        freq = self._first_present(pillar, self._PILLAR_FREQUENCY_KEYS)
                         if freq:
-                            elements.append(Paragraph(f"Frequency: {freq}", self.styles['GenomeBodyText']))
+                            pillar_rows.append(("Frequency:", _esc(freq)))
 
+                        if pillar_rows:
+                            elements.append(self._label_value_table(pillar_rows))
                         elements.append(Spacer(1, 0.15*inch))
                     else:
-                        elements.append(Paragraph(f"• {pillar}", self.styles['GenomeBulletText']))
+                        elements.append(Paragraph(f"• {_esc(pillar)}", bullet))
             elif isinstance(pillars, dict):
-                for pillar_name, pillar_topics in list(pillars.items())[:5]:
-                    elements.append(Paragraph(f"<b>{pillar_name}</b>", self.styles['GenomeBodyText']))
+                for pillar_name, pillar_topics in islice(pillars.items(), 5):
+                    elements.append(Paragraph(f"<b>{_esc(pillar_name)}</b>", body))
                     if isinstance(pillar_topics, list):
-                        for topic in pillar_topics[:3]:
-                            elements.append(Paragraph(f"  - {topic}", self.styles['GenomeBulletText']))
+                        elements.extend(Paragraph(f"  - {_esc(topic)}", bullet) for topic in pillar_topics[:3])
 
         # Content formats - try multiple variations
-        formats = (content_strategy.get('content_formats') or content_strategy.get('formats') or
-                   content_strategy.get('content_types') or [])
+        formats = self._first_present(content_strategy, self._FORMAT_KEYS, [])
         if formats:
-            elements.append(Paragraph("Recommended Content Formats", self.styles['GenomeSubHeader']))
+            elements.append(Paragraph("Recommended Content Formats", sub))
             if isinstance(formats, list):
-                for fmt in formats[:6]:
-                    elements.append(Paragraph(f"• {fmt}", self.styles['GenomeBulletText']))
+                elements.extend(Paragraph(f"• {fmt}", bullet) for fmt in formats[:6])
             elif isinstance(formats, dict):
-                for key, value in list(formats.items())[:6]:
-                    elements.append(Paragraph(f"• {key}: {value}", self.styles['GenomeBulletText']))
+                elements.extend(Paragraph(f"• {key}: {value}", bullet) for key, value in islice(formats.items(), 6))
             elif isinstance(formats, str):
-                elements.append(Paragraph(formats, self.styles['GenomeBodyText']))
+                elements.append(Paragraph(formats, body))
 
         # Posting frequency - try multiple variations
-        frequency = (content_strategy.get('posting_frequency') or content_strategy.get('frequency') or
-                     content_strategy.get('schedule') or content_strategy.get('posting_schedule') or {})
+        frequency = self._first_present(content_strategy, self._FREQUENCY_KEYS, {})
         if frequency:
-            elements.append(Paragraph("Posting Schedule", self.styles['GenomeSubHeader']))
+            elements.append(Paragraph("Posting Schedule", sub))
             if isinstance(frequency, dict):
-                for platform, freq in list(frequency.items())[:5]:
-                    elements.append(Paragraph(f"• {platform}: {freq}", self.styles['GenomeBulletText']))
+                elements.extend(Paragraph(f"• {platform}: {freq}", bullet) for platform, freq in islice(frequency.items(), 5))
             elif isinstance(frequency, str):
-                elements.append(Paragraph(frequency, self.styles['GenomeBodyText']))
+                elements.append(Paragraph(frequency, body))
             elif isinstance(frequency, list):
-                for item in frequency[:5]:
-                    elements.append(Paragraph(f"• {item}", self.styles['GenomeBulletText']))
+                elements.extend(Paragraph(f"• {item}", bullet) for item in frequency[:5])
 
         # If nothing was found, extract any available content
         # But skip brandDNA since it's not part of content strategy
         if not pillars and not formats and not frequency:
-            elements.append(Paragraph("Content Strategy Overview", self.styles['GenomeSubHeader']))
-            for key, value in list(content_strategy.items())[:10]:
+            elements.append(Paragraph("Content Strategy Overview", sub))
+            lines = []
+            for key, value in islice(content_strategy.items(), 10):
                 # Skip brandDNA - it's metadata, not content strategy
-                if key in ['brandDNA', 'brand_dna', 'branddna']:
+                if key in _SKIP_CS_KEYS:
+                    continue
+
+                if type(value) is str:
+                    lines.append(f"<b>{_pretty(key)}:</b> {value}")
                     continue
 
-                if isinstance(value, str):
-                    elements.append(Paragraph(f"<b>{key.replace('_', ' ').title()}:</b> {value}", self.styles['GenomeBodyText']))
-                elif isinstance(value, list):
+                self._flush_lines(elements, lines, body)
+                if type(value) is list:
                     # Don't show raw dict strings
-                    elements.append(Paragraph(f"<b>{key.replace('_', ' ').title()}:</b>", self.styles['GenomeBodyText']))
+                    elements.append(Paragraph(f"<b>{_pretty(key)}:</b>", body))
                     for item in value[:5]:
                         # Only show if it's a string, not a dict
-                        if isinstance(item, str):
-                            elements.append(Paragraph(f"  • {item}", self.styles['GenomeBulletText']))
-                elif isinstance(value, dict):
-                    elements.append(Paragraph(f"<b>{key.replace('_', ' ').title()}:</b>", self.styles['GenomeBodyText']))
-                    for sub_key, sub_value in list(value.items())[:3]:
+                        if type(item) is str:
+                            elements.append(Paragraph(f"  • {item}", bullet))
+                elif type(value) is dict:
+                    elements.append(Paragraph(f"<b>{_pretty(key)}:</b>", body))
+                    for sub_key, sub_value in islice(value.items(), 3):
                         # Format the sub_value properly
-                        if isinstance(sub_value, (str, int, float)):
-                            elements.append(Paragraph(f"  • {sub_key}: {sub_value}", self.styles['GenomeBulletText']))
-                        elif isinstance(sub_value, list):
-                            val_str = ', '.join(str(v) for v in sub_value[:3])
-                            elements.append(Paragraph(f"  • {sub_key}: {val_str}", self.styles['GenomeBulletText']))
+                        if type(sub_value) in (str, int, float, bool):
+                            elements.append(Paragraph(f"  • {sub_key}: {sub_value}", bullet))
+                        elif type(sub_value) is list:
+                            val_str = _joinable(sub_value[:3])
+                            elements.append(Paragraph(f"  • {sub_key}: {val_str}", bullet))
+            self._flush_lines(elements, lines, body)
 
         # Footer
         elements.append(Spacer(1, inch))
         elements.append(Paragraph(
             "Report generated by Genome AI - Your AI-Powered Marketing Strategist",
-            ParagraphStyle(
-                'Footer',
-                parent=self.styles['Normal'],
-                fontSize=9,
-                textColor=colors.grey,
-                alignment=TA_CENTER
-            )
+            self.styles['GenomeFooter']
         ))
 
         return elements
+
+
+def _generate_report_job(job: tuple) -> str:
+    """Worker for PixaroReportGenerator.generate_batch (module-level so it can be pickled)"""
+    genome_data, brand_input = job
+    return PixaroReportGenerator().generate_report(genome_data, brand_input)